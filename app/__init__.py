@@ -4,28 +4,133 @@ which initializes and configures the Flask app and its extensions. It also
 defines the API resources and their endpoints.
 
 Dependencies:
+    - importlib
+    - sqlite3
+    - click
     - Flask
     - Flask-Migrate
     - Flask-RESTful
     - Flask-SQLAlchemy
+    - SQLAlchemy
     - app.config.Config (module)
     - app.utils.logging.setup_logging (function)
+    - app.utils.serialization.OrjsonProvider (class)
+    - app.utils.serialization.output_json (function)
 
 Exported Functions:
     - create_app(config_class=Config): Creates and configures the Flask app.
 
 """
 
+import importlib
+import sqlite3
+
+import click
 from flask import Flask
-from flask_migrate import Migrate
-from flask_restful import Api
+from flask_restful import Api, Resource
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 
 from app.config import Config
 from app.utils.logging import setup_logging
+from app.utils.serialization import OrjsonProvider, output_json
 
 db = SQLAlchemy()
-migrate = Migrate(db)
+
+
+@event.listens_for(Engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+    """
+    Tunes every new SQLite connection: write-ahead logging lets readers run alongside
+    a writer, and synchronous=NORMAL only syncs at WAL checkpoints instead of on every
+    commit. Connections to other databases are left untouched.
+
+    Args:
+        - dbapi_connection: The DBAPI connection that was just opened.
+        - _connection_record: The pool's record of the connection.
+
+    """
+
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.close()
+
+
+class _MigrateGroup(click.Group):
+    """
+    The `flask db` command group. Flask-Migrate, and Alembic behind it, is only imported
+    and registered on the app when a migration command is looked up, so the app starts
+    without them. The commands themselves are the ones of Flask-Migrate.
+
+    Methods:
+        - list_commands(ctx): Lists the Flask-Migrate commands.
+        - get_command(ctx, cmd_name): Returns the Flask-Migrate command with the given name.
+
+    """
+
+    def __init__(self, app):
+        super().__init__(name="db", help="Perform database migrations.")
+        self.app = app
+
+    def _migrate_group(self):
+        import flask_migrate.cli  # pylint: disable=import-outside-toplevel
+
+        if "migrate" not in self.app.extensions:
+            flask_migrate.Migrate(self.app, db)
+        return flask_migrate.cli.db
+
+    def list_commands(self, ctx):
+        return self._migrate_group().list_commands(ctx)
+
+    def get_command(self, ctx, cmd_name):
+        return self._migrate_group().get_command(ctx, cmd_name)
+
+
+def _lazy_resource(import_path, methods):
+    """
+    Creates a placeholder resource for the resource class at the given dotted import path.
+    The module defining the resource is imported on the first request to the endpoint
+    instead of at application start-up. A single placeholder and a single resource
+    instance serve every request to the endpoint, as the resources keep no per-request state.
+
+    Args:
+        - import_path (str): The dotted import path of the resource class.
+        - methods (tuple): The HTTP methods the resource class implements.
+
+    Returns:
+        - LazyResource (Resource): A resource class delegating to the imported resource class.
+
+    """
+
+    module_name, class_name = import_path.rsplit(".", 1)
+
+    class LazyResource(Resource):
+        """
+        A resource that imports and instantiates the actual resource class on first dispatch
+        and delegates every request to that instance.
+
+        """
+
+        init_every_request = False
+        resource = None
+
+        def dispatch_request(self, *args, **kwargs):
+            if self.resource is None:
+                resource_class = getattr(
+                    importlib.import_module(module_name), class_name
+                )
+                self.resource = resource_class()
+            return self.resource.dispatch_request(*args, **kwargs)
+
+    LazyResource.__name__ = class_name
+    LazyResource.methods = set(methods)
+    return LazyResource
 
 
 def create_app(config_class=Config):  # pylint: disable=too-many-locals
@@ -45,30 +150,40 @@ def create_app(config_class=Config):  # pylint: disable=too-many-locals
 
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.json = OrjsonProvider(app)
 
     db.init_app(app)
-    migrate.init_app(app, db)
 
-    from app.rest.purses import (  # pylint: disable=import-outside-toplevel, cyclic-import
-        PursesAPI,
-        PursesListAPI,
+    app.cli.add_command(_MigrateGroup(app))
+
+    api = Api(prefix="/api")
+    api.representations["application/json"] = output_json
+    api.add_resource(
+        _lazy_resource("app.rest.users.UsersListAPI", ("GET", "POST")), "/users/"
     )
-    from app.rest.transactions import (  # pylint: disable=import-outside-toplevel, cyclic-import
-        TransactionsAPI,
-        TransactionsListAPI,
+    api.add_resource(
+        _lazy_resource("app.rest.users.UsersAPI", ("GET", "PUT", "DELETE")),
+        "/users/<int:_id>",
     )
-    from app.rest.users import (  # pylint: disable=import-outside-toplevel, cyclic-import
-        UsersAPI,
-        UsersListAPI,
+    api.add_resource(
+        _lazy_resource("app.rest.purses.PursesListAPI", ("GET", "POST")), "/purses/"
+    )
+    api.add_resource(
+        _lazy_resource("app.rest.purses.PursesAPI", ("GET", "DELETE")),
+        "/purses/<int:_id>",
+    )
+    api.add_resource(
+        _lazy_resource("app.rest.transactions.TransactionsListAPI", ("GET", "POST")),
+        "/transactions/",
+    )
+    api.add_resource(
+        _lazy_resource("app.rest.transactions.TransactionsAPI", ("GET",)),
+        "/transactions/<int:_id>",
+    )
+    api.add_resource(
+        _lazy_resource("app.rest.transactions.TransactionsBulkAPI", ("POST",)),
+        "/transactions/bulk",
     )
-
-    api = Api(prefix="/api")
-    api.add_resource(UsersListAPI, "/users/")
-    api.add_resource(UsersAPI, "/users/<int:_id>")
-    api.add_resource(PursesListAPI, "/purses/")
-    api.add_resource(PursesAPI, "/purses/<int:_id>")
-    api.add_resource(TransactionsListAPI, "/transactions/")
-    api.add_resource(TransactionsAPI, "/transactions/<int:_id>")
 
     api.init_app(app)
 
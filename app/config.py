@@ -1,22 +1,61 @@
 """
-This module contains the configuration dataclasses for the Flask application.
+This module contains the configuration classes for the Flask application.
 
 Dependencies:
     - os
-    - dataclasses
+    - sqlalchemy.engine
+    - sqlalchemy.pool
 
 Exported Classes:
     - Config: The base configuration class.
     - TestingConfig(Config): The configuration class for running tests.
 
+Functions:
+    - _engine_options(database_uri): Returns the engine options for a database URI.
+
 """
 
-import dataclasses
 import os
 
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
+
+
+def _engine_options(database_uri):
+    """
+    Returns the SQLAlchemy engine options for the given database URI.
+
+    An in-memory SQLite database lives inside a single connection, so it is shared
+    through StaticPool; the pool sizing options would be rejected by its default
+    SingletonThreadPool. Every other database, file SQLite included, gets a QueuePool.
+
+    Args:
+        - database_uri (str): The URI of the database.
+
+    Returns:
+        - dict: The options passed to the engine.
+
+    """
+
+    url = make_url(database_uri)
+    if url.get_backend_name() == "sqlite" and (
+        url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+    ):
+        return {
+            "poolclass": StaticPool,
+            "connect_args": {"check_same_thread": False},
+        }
+    return {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+        "pool_use_lifo": True,
+    }
+
 
-@dataclasses.dataclass
-class Config:
+class Config:  # pylint: disable=too-few-public-methods
     """
     The base configuration class for the Flask application.
 
@@ -24,6 +63,10 @@ class Config:
         - SECRET_KEY (str): The secret key for the Flask app.
         - SQLALCHEMY_DATABASE_URI (str): The URI of the database to use.
         - SQLALCHEMY_TRACK_MODIFICATIONS (bool): Whether to track modifications to the database.
+        - SQLALCHEMY_ENGINE_OPTIONS (dict): The connection pool options passed to the engine.
+        Connections are reused in LIFO order, so hot connections stay hot and idle ones
+        are retired by pool_recycle. An in-memory SQLite database shares a single
+        connection instead.
         - DEBUG (bool): Whether to run the app in debug mode.
 
     """
@@ -31,16 +74,17 @@ class Config:
     SECRET_KEY = os.environ.get("SECRET_KEY") or "my-secret-key"
     SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL") or "sqlite:///" + "dev.db"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options(SQLALCHEMY_DATABASE_URI)
     DEBUG = True
 
 
-@dataclasses.dataclass
-class TestingConfig(Config):
+class TestingConfig(Config):  # pylint: disable=too-few-public-methods
     """
     The configuration class for running tests.
 
     Attributes:
         - SQLALCHEMY_DATABASE_URI (str): The URI of the test database to use.
+        - SQLALCHEMY_ENGINE_OPTIONS (dict): The engine options for the test database.
         - TESTING (bool): Whether the app is running in test mode.
         - DEBUG (bool): Whether to run the app in debug mode during tests.
 
@@ -49,6 +93,7 @@ class TestingConfig(Config):
     SQLALCHEMY_DATABASE_URI = (
         os.environ.get("TEST_DATABASE_URL") or "sqlite:///" + "test.db"
     )
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options(SQLALCHEMY_DATABASE_URI)
     TESTING = True
     WTF_CSRF_ENABLED = False
     DEBUG = False
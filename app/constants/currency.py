@@ -9,6 +9,11 @@ Dependencies:
 Exported Classes:
     - Currency: An enumeration of currencies supported in the application.
 
+Exported Variables:
+    - CURRENCY_BY_CODE (dict): Maps a currency code to its Currency member.
+    - CURRENCY_IDX (dict): Maps a Currency member to its ordinal.
+    - CURRENCY_CODE (dict): Maps a Currency member, or a currency code, to the currency code.
+
 """
 
 from enum import Enum, unique
@@ -31,3 +36,15 @@ class Currency(Enum):
     EUR = "EUR"
     GBP = "GBP"
     UAH = "UAH"
+
+
+# Plain dict lookups that skip EnumMeta.__call__ when coercing codes or indexing tables.
+CURRENCY_BY_CODE: dict[str, Currency] = {
+    currency.value: currency for currency in Currency
+}
+CURRENCY_IDX: dict[Currency, int] = {
+    currency: index for index, currency in enumerate(Currency)
+}
+CURRENCY_CODE: dict = {currency: currency.value for currency in Currency} | {
+    code: code for code in CURRENCY_BY_CODE
+}
@@ -0,0 +1,9 @@
+"""
+This module contains the pagination limits shared by the list endpoints of the REST API.
+
+Exported Variables:
+    - MAX_PER_PAGE (int): The largest page a list endpoint returns, whatever limit is requested.
+
+"""
+
+MAX_PER_PAGE = 1000
@@ -2,6 +2,7 @@
 This module contains a single class, Rates, which represents enumerated currency exchange rates.
 
 Dependencies:
+    - functools.lru_cache (built-in)
     - enum.Enum (built-in)
     - enum.unique (built-in)
 
@@ -11,8 +12,9 @@ Exported Classes:
 """
 
 from enum import Enum, unique
+from functools import lru_cache
 
-from app.constants.currency import Currency
+from app.constants.currency import CURRENCY_IDX, Currency
 
 
 @unique
@@ -54,9 +56,11 @@ class Rates(Enum):
     }
 
     @classmethod
+    @lru_cache(maxsize=len(Currency) ** 2)
     def get_rate(cls, currency_from: Currency, currency_to: Currency) -> float:
         """
-        A method that returns the exchange rate between two currencies.
+        A method that returns the exchange rate between two currencies. The rates are
+        constant, so each currency pair is looked up once and then served from the cache.
 
         Args:
             - currency_from (Currency): The currency to convert from.
@@ -67,4 +71,14 @@ class Rates(Enum):
 
         """
 
-        return cls[currency_from.name].value[currency_to]
+        return _RATES[CURRENCY_IDX[currency_from]][CURRENCY_IDX[currency_to]]
+
+
+# The rates flattened into a tuple of tuples indexed by the currency ordinal,
+# so get_rate does two tuple indexes instead of an Enum lookup and a dict lookup.
+# Both levels iterate Currency and look the rates up by name, so the table doesn't
+# depend on Rates being declared in the same order as Currency.
+_RATES = tuple(
+    tuple(Rates[currency_from.name].value[currency_to] for currency_to in Currency)
+    for currency_from in Currency
+)
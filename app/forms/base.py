@@ -30,8 +30,20 @@ class BaseSearchForm(FlaskForm):
         - date_modified (StringField): The date modified field for filtering search results
         by modification date.
 
+    Search forms are only submitted through GET query strings and never change data, so CSRF
+    protection is disabled for them. This saves generating and checking a signed token on
+    every list request.
+
     """
 
+    class Meta:  # pylint: disable=too-few-public-methods
+        """
+        Form options for the search forms.
+
+        """
+
+        csrf = False
+
     search = StringField(validators=[Optional()])
     date_created = StringField(validators=[Optional()])
     date_modified = StringField(validators=[Optional()])
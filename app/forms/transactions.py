@@ -6,6 +6,7 @@ Dependencies:
     - flask_wtf
     - wtforms
     - wtforms.validators
+    - app.db
     - app.forms.base
     - app.models.purses
 
@@ -19,6 +20,7 @@ from flask_wtf import FlaskForm
 from wtforms import StringField
 from wtforms.validators import DataRequired, Optional
 
+from app import db
 from app.forms.base import BaseSearchForm
 from app.models.purses import Purse
 
@@ -71,6 +73,7 @@ class TransactionForm(FlaskForm):
         - purse_to_amount (StringField): The purse to amount field for filtering search results
         by purse to amount.
         - date_created (StringField): The date created field for filtering search results
+        - purse_from (Purse): The sender purse if the caller has already loaded it.
 
     """
 
@@ -80,6 +83,10 @@ class TransactionForm(FlaskForm):
     purse_to_amount = StringField("Purse to amount")
     date_created = StringField("Date created")
 
+    def __init__(self, *args, purse_from=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.purse_from = purse_from
+
     def validate(self, extra_validators=None):
         """
         Validates the form. This method overrides the `validate` method of the FlaskForm class.
@@ -99,9 +106,17 @@ class TransactionForm(FlaskForm):
             )
             return False
 
-        if Purse.query.get(self.purse_from_id.data).balance < float(
-            self.purse_from_amount.data
-        ):
+        # The view passes in the purse it has loaded, so it is reused when the transaction
+        # is applied; otherwise Session.get() looks it up through the identity map.
+        purse_from = self.purse_from or db.session.get(
+            Purse, int(self.purse_from_id.data)
+        )
+        if purse_from is None:
+            self.purse_from_id.errors.append("Purse from id does not exist.")
+            return False
+
+        purse_from_amount = float(self.purse_from_amount.data)
+        if purse_from.balance < purse_from_amount:
             self.purse_from_id.errors.append(
                 "Purse from id does not have enough balance."
             )
@@ -6,6 +6,7 @@ Dependencies:
     - datetime
     - app.db
     - app.constants.currency
+    - app.utils.formatting
 
 Exported classes:
     - Purse
@@ -15,7 +16,8 @@ Exported classes:
 from datetime import datetime
 
 from app import db
-from app.constants.currency import Currency
+from app.constants.currency import CURRENCY_CODE, Currency
+from app.utils.formatting import datetime_str
 
 
 class Purse(db.Model):
@@ -24,6 +26,7 @@ class Purse(db.Model):
 
     Attributes:
         - __tablename__ (str): The name of the database table for this model.
+        - __table_args__ (tuple): The composite index used to look up a user's active purses.
         - id (int): The unique identifier of the purse.
         - user_id (int): The ID of the user who owns the purse.
         - currency (Currency): The currency type of the purse.
@@ -31,6 +34,7 @@ class Purse(db.Model):
         - date_created (datetime): The date and time when the purse was created.
         - date_modified (datetime): The date and time when the purse was last modified.
         - is_active (bool): A flag indicating whether the purse is active.
+        - user (User): The user who owns the purse.
         - transactions_from (list): A list of transactions where the purse is the sender.
         - transactions_to (list): A list of transactions where the purse is the recipient.
 
@@ -39,11 +43,15 @@ class Purse(db.Model):
         - date_created_str(self): Converts the date_created attribute to a string.
         - date_modified_str(self): Converts the date_modified attribute to a string.
         - to_dict(self): Returns a dictionary representation of the purse.
+        - to_dicts(cls, limit=None, offset=0): Returns dictionary representations of the purses
+        ordered by id.
         - update(self, **kwargs): Updates the purse with the provided keyword arguments.
+        - bulk_insert(cls, rows): Inserts many purses in a single executemany statement.
 
     """
 
     __tablename__ = "purses"
+    __table_args__ = (db.Index("ix_purses_user_id_is_active", "user_id", "is_active"),)
     id = db.Column(db.Integer, primary_key=True)
 
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
@@ -57,18 +65,18 @@ class Purse(db.Model):
 
     is_active = db.Column(db.Boolean, nullable=False, default=True)
 
+    user = db.relationship("User", back_populates="purses", lazy="raise")
+
     transactions_from = db.relationship(
         "Transaction",
         foreign_keys="Transaction.purse_from_id",
-        backref="purse_from",
-        lazy="dynamic",
+        back_populates="purse_from",
     )
 
     transactions_to = db.relationship(
         "Transaction",
         foreign_keys="Transaction.purse_to_id",
-        backref="purse_to",
-        lazy="dynamic",
+        back_populates="purse_to",
     )
 
     def __repr__(self):
@@ -80,10 +88,10 @@ class Purse(db.Model):
 
         """
 
-        return f"Purse id: {self.id}, \
-            user_id: {self.user_id}, \
-            currency: {self.currency}, \
-            balance: {self.balance}"
+        return (
+            f"Purse(id={self.id}, user_id={self.user_id}, "
+            f"currency={self.currency}, balance={self.balance})"
+        )
 
     def date_created_str(self):
         """
@@ -95,7 +103,7 @@ class Purse(db.Model):
 
         """
 
-        return self.date_created.strftime("%Y-%m-%d %H:%M:%S")
+        return datetime_str(self.date_created)
 
     def date_modified_str(self):
         """
@@ -107,7 +115,7 @@ class Purse(db.Model):
 
         """
 
-        return self.date_modified.strftime("%Y-%m-%d %H:%M:%S")
+        return datetime_str(self.date_modified)
 
     def to_dict(self):
         """
@@ -121,20 +129,78 @@ class Purse(db.Model):
         return {
             "id": self.id,
             "user_id": self.user_id,
-            "currency": Currency(self.currency).value,
+            "currency": CURRENCY_CODE[self.currency],
             "balance": self.balance,
-            "date_created": self.date_created_str(),
-            "date_modified": self.date_modified_str(),
+            "date_created": datetime_str(self.date_created),
+            "date_modified": datetime_str(self.date_modified),
         }
 
+    @classmethod
+    def to_dicts(cls, limit=None, offset=0):
+        """
+        Returns dictionary representations of the purses ordered by id, in the to_dict format.
+        Only the needed columns are selected and no Purse objects are built.
+
+        Parameters:
+            - limit (int, optional): The maximum number of rows to return. Defaults to all rows.
+            - offset (int, optional): The number of rows to skip. Defaults to 0.
+
+        Returns:
+            - list: A list of dictionaries representing the purses.
+
+        """
+
+        rows = db.session.execute(
+            db.select(
+                cls.id,
+                cls.user_id,
+                cls.currency,
+                cls.balance,
+                cls.date_created,
+                cls.date_modified,
+            )
+            .order_by(cls.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        return [
+            {
+                "id": _id,
+                "user_id": user_id,
+                "currency": CURRENCY_CODE[currency],
+                "balance": balance,
+                "date_created": datetime_str(date_created),
+                "date_modified": datetime_str(date_modified),
+            }
+            for _id, user_id, currency, balance, date_created, date_modified in rows
+        ]
+
     def update(self, **kwargs):
         """
-        Updates the Purse object with the given keyword arguments.
+        Updates the Purse object with the given keyword arguments. The date_created and
+        date_modified attributes are removed from the dictionary.
 
         Parameters:
             - **kwargs: Keyword arguments to update the Purse object with.
 
         """
 
+        kwargs.pop("date_created", None)
+        kwargs.pop("date_modified", None)
+
         for key, value in kwargs.items():
             setattr(self, key, value)
+
+    @classmethod
+    def bulk_insert(cls, rows):
+        """
+        Inserts many purses in a single executemany INSERT statement, without building an ORM
+        object for each row. Column defaults are still applied. Nothing is committed here.
+
+        Parameters:
+            - rows (list): A list of dictionaries with the column values of each purse.
+
+        """
+
+        if rows:
+            db.session.execute(db.insert(cls), rows)
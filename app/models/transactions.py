@@ -9,8 +9,10 @@ Dependencies:
     - app.constants.currency
     - app.constants.rates
     - app.models.purses
+    - app.utils.formatting
 
 Exported classes:
+    - InsufficientFunds
     - Transaction
 
 """
@@ -19,9 +21,26 @@ import logging
 from datetime import datetime
 
 from app import db
-from app.constants.currency import Currency
+from app.constants.currency import CURRENCY_CODE, Currency
 from app.constants.rates import Rates
 from app.models.purses import Purse
+from app.utils.formatting import datetime_str
+
+logger = logging.getLogger(__name__)
+
+
+class InsufficientFunds(Exception):
+    """
+    Raised when a purse doesn't have enough money for a transaction.
+
+    Attributes:
+        - purse_id (int): The ID of the purse that doesn't have enough money.
+
+    """
+
+    def __init__(self, purse_id):
+        super().__init__(f"Purse {purse_id} doesn't have enough money.")
+        self.purse_id = purse_id
 
 
 class Transaction(db.Model):
@@ -30,6 +49,8 @@ class Transaction(db.Model):
 
     Attributes:
         - __tablename__ (str): The name of the database table for this model.
+        - __table_args__ (tuple): The composite indexes used to list a purse's transactions
+        by date.
         - id (int): The unique identifier of the transaction.
         - purse_from_id (int): The ID of the purse where the money comes from.
         - purse_to_id (int): The ID of the purse where the money goes to.
@@ -38,16 +59,31 @@ class Transaction(db.Model):
         - purse_from_amount (float): The amount of money that is being transferred from the purse.
         - purse_to_amount (float): The amount of money that is being transferred to the purse.
         - date_created (datetime): The date and time when the transaction was created.
+        - purse_from (Purse): The purse where the money comes from.
+        - purse_to (Purse): The purse where the money goes to.
 
     Methods:
         - __repr__(self): Returns a string representation of the transaction.
         - date_created_str(self): Converts the date_created attribute to a string.
         - to_dict(self): Returns a dictionary representation of the transaction.
+        - to_dicts(cls, limit=None, offset=0): Returns dictionary representations of the
+        transactions ordered by id.
         - update(self, **args): Updates the transaction with the provided values.
+        - bulk_insert(cls, rows): Inserts many transactions in a single executemany statement.
 
     """
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        db.Index(
+            "ix_transactions_purse_from_id_date_created",
+            "purse_from_id",
+            "date_created",
+        ),
+        db.Index(
+            "ix_transactions_purse_to_id_date_created", "purse_to_id", "date_created"
+        ),
+    )
     id = db.Column(db.Integer, primary_key=True)
 
     purse_from_id = db.Column(db.Integer, db.ForeignKey("purses.id"), nullable=False)
@@ -61,6 +97,21 @@ class Transaction(db.Model):
 
     date_created = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
 
+    # lazy="raise" makes an accidental per-row load of a purse fail loudly instead of
+    # silently issuing one SELECT per transaction.
+    purse_from = db.relationship(
+        "Purse",
+        foreign_keys=[purse_from_id],
+        back_populates="transactions_from",
+        lazy="raise",
+    )
+    purse_to = db.relationship(
+        "Purse",
+        foreign_keys=[purse_to_id],
+        back_populates="transactions_to",
+        lazy="raise",
+    )
+
     def __repr__(self):
         """
         Returns a string representation of the transaction.
@@ -70,13 +121,14 @@ class Transaction(db.Model):
 
         """
 
-        return f"Transaction id: {self.id}, \
-            purse_from_id: {self.purse_from_id}, \
-            purse_to_id: {self.purse_to_id}, \
-            purse_from_currency: {self.purse_from_currency}, \
-            purse_to_currency: {self.purse_to_currency}, \
-            purse_from_amount: {self.purse_from_amount}, \
-            purse_to_amount: {self.purse_to_amount}"
+        return (
+            f"Transaction(id={self.id}, "
+            f"purse_from_id={self.purse_from_id}, purse_to_id={self.purse_to_id}, "
+            f"purse_from_currency={self.purse_from_currency}, "
+            f"purse_to_currency={self.purse_to_currency}, "
+            f"purse_from_amount={self.purse_from_amount}, "
+            f"purse_to_amount={self.purse_to_amount})"
+        )
 
     def date_created_str(self):
         """
@@ -88,7 +140,7 @@ class Transaction(db.Model):
 
         """
 
-        return self.date_created.strftime("%Y-%m-%d %H:%M:%S")
+        return datetime_str(self.date_created)
 
     def to_dict(self):
         """
@@ -103,23 +155,85 @@ class Transaction(db.Model):
             "id": self.id,
             "purse_from_id": self.purse_from_id,
             "purse_to_id": self.purse_to_id,
-            "purse_from_currency": Currency(self.purse_from_currency).value,
-            "purse_to_currency": Currency(self.purse_to_currency).value,
+            "purse_from_currency": CURRENCY_CODE[self.purse_from_currency],
+            "purse_to_currency": CURRENCY_CODE[self.purse_to_currency],
             "purse_from_amount": self.purse_from_amount,
             "purse_to_amount": self.purse_to_amount,
-            "date_created": self.date_created_str(),
+            "date_created": datetime_str(self.date_created),
         }
 
+    @classmethod
+    def to_dicts(cls, limit=None, offset=0, after_id=None):
+        """
+        Returns dictionary representations of the transactions ordered by id, in the to_dict
+        format. Only the needed columns are selected and no Transaction objects are built.
+
+        Parameters:
+            - limit (int, optional): The maximum number of rows to return. Defaults to all rows.
+            - offset (int, optional): The number of rows to skip. Defaults to 0.
+            - after_id (int, optional): Only the transactions with a greater id are returned.
+            Unlike offset, the skipped rows are not scanned. Defaults to all transactions.
+
+        Returns:
+            - list: A list of dictionaries representing the transactions.
+
+        """
+
+        query = (
+            db.select(
+                cls.id,
+                cls.purse_from_id,
+                cls.purse_to_id,
+                cls.purse_from_currency,
+                cls.purse_to_currency,
+                cls.purse_from_amount,
+                cls.purse_to_amount,
+                cls.date_created,
+            )
+            .order_by(cls.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        if after_id is not None:
+            query = query.where(cls.id > after_id)
+        rows = db.session.execute(query)
+        return [
+            {
+                "id": row.id,
+                "purse_from_id": row.purse_from_id,
+                "purse_to_id": row.purse_to_id,
+                "purse_from_currency": CURRENCY_CODE[row.purse_from_currency],
+                "purse_to_currency": CURRENCY_CODE[row.purse_to_currency],
+                "purse_from_amount": row.purse_from_amount,
+                "purse_to_amount": row.purse_to_amount,
+                "date_created": datetime_str(row.date_created),
+            }
+            for row in rows
+        ]
+
     def update(self, **kwargs):
         """
-        Updates the Transaction object with the given keyword arguments
+        Updates the Transaction object with the given keyword arguments and moves the money
+        between the two purses. Nothing is committed here: the caller commits the balance
+        changes together with the transaction, so a batch of transactions costs one commit.
+
+        The purses can be passed in as purse_from and purse_to when the caller already has
+        them, otherwise they are fetched by id through the session's identity map.
 
         Parameters:
             - **kwargs: Keyword arguments to update the Transaction object with.
 
+        Raises:
+            - InsufficientFunds: If the purse the money comes from doesn't have enough money.
+            Nothing has been written to the purses then.
+
         """
-        purse_from = Purse.query.get_or_404(kwargs["purse_from_id"])
-        purse_to = Purse.query.get_or_404(kwargs["purse_to_id"])
+        purse_from = kwargs.pop("purse_from", None) or db.get_or_404(
+            Purse, int(kwargs["purse_from_id"])
+        )
+        purse_to = kwargs.pop("purse_to", None) or db.get_or_404(
+            Purse, int(kwargs["purse_to_id"])
+        )
         purse_from_amount = float(kwargs["purse_from_amount"])
 
         kwargs["purse_from_currency"] = purse_from.currency
@@ -129,31 +243,50 @@ class Transaction(db.Model):
             kwargs["purse_to_amount"] = purse_from_amount * Rates.get_rate(
                 kwargs["purse_from_currency"], kwargs["purse_to_currency"]
             )
-            logging.info(
-                "Transaction creation success. Purse from currency %s \
-                    is different from purse to currency %s. \
-                    Purse to amount is calculated using the exchange rate.",
-                kwargs["purse_from_currency"],
-                kwargs["purse_to_currency"],
-            )
         else:
             kwargs["purse_to_amount"] = purse_from_amount
 
-        if purse_from.currency != purse_to.currency:
-            purse_to_amount = kwargs["purse_to_amount"]
-            purse_to.update(balance=purse_to.balance + purse_to_amount)
-            purse_from.update(balance=purse_from.balance - purse_from_amount)
-        else:
-            purse_to.update(balance=purse_to.balance + purse_from_amount)
-            purse_from.update(balance=purse_from.balance - purse_from_amount)
-
-        logging.info(
-            "Transaction creation success. Purse from balance is decreased by %s. \
-                Purse to balance is increased by %s.",
-            purse_from_amount,
-            kwargs["purse_to_amount"],
+        # The balance check and the arithmetic run inside the UPDATE statements, so a
+        # concurrent transfer can't overdraw the purse between reading and writing its
+        # balance. Loaded purses are kept in sync by the ORM-enabled UPDATE.
+        debited = db.session.execute(
+            db.update(Purse)
+            .where(Purse.id == purse_from.id, Purse.balance >= purse_from_amount)
+            .values(balance=Purse.balance - purse_from_amount)
+        )
+        if debited.rowcount == 0:
+            raise InsufficientFunds(purse_from.id)
+        db.session.execute(
+            db.update(Purse)
+            .where(Purse.id == purse_to.id)
+            .values(balance=Purse.balance + kwargs["purse_to_amount"])
         )
-        db.session.commit()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Transaction creation success. Purse from balance is decreased by %s %s. "
+                "Purse to balance is increased by %s %s.",
+                purse_from_amount,
+                kwargs["purse_from_currency"],
+                kwargs["purse_to_amount"],
+                kwargs["purse_to_currency"],
+            )
 
         for key, value in kwargs.items():
             setattr(self, key, value)
+        self.purse_from = purse_from
+        self.purse_to = purse_to
+
+    @classmethod
+    def bulk_insert(cls, rows):
+        """
+        Inserts many transactions in a single executemany INSERT statement, without building an ORM
+        object for each row. Column defaults are still applied. Nothing is committed here.
+
+        Parameters:
+            - rows (list): A list of dictionaries with the column values of each transaction.
+
+        """
+
+        if rows:
+            db.session.execute(db.insert(cls), rows)
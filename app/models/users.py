@@ -5,15 +5,27 @@ It also contains functions for converting date and time objects to string repres
 Dependencies:
     - datetime
     - app.db
+    - app.utils.formatting
 
 Exported classes:
     - User
 
 """
 
-from datetime import datetime
+from datetime import date, datetime
 
 from app import db
+from app.utils.formatting import date_str, datetime_str
+
+# The attributes User.update assigns as given; birth_date is parsed separately
+_UPDATABLE_FIELDS = (
+    "username",
+    "email",
+    "phone",
+    "first_name",
+    "last_name",
+    "is_active",
+)
 
 
 class User(db.Model):
@@ -40,7 +52,10 @@ class User(db.Model):
         - date_modified_str(self): Converts the date_modified attribute to a string.
         - __repr__(self): Returns a string representation of the User.
         - to_dict(self): Returns a dictionary representation of the User.
+        - to_dicts(cls, limit=None, offset=0): Returns dictionary representations of the Users
+        ordered by id.
         - update(self, **kwargs): Updates the User with the provided keyword arguments.
+        - bulk_insert(cls, rows): Inserts many users in a single executemany statement.
     """
 
     __tablename__ = "users"
@@ -61,7 +76,9 @@ class User(db.Model):
 
     is_active = db.Column(db.Boolean, nullable=False, default=True)
 
-    purses = db.relationship("Purse", backref="user", lazy=True)
+    # lazy="raise" makes an accidental per-user load of the purses fail loudly; the users
+    # list loads them for the whole page with selectinload.
+    purses = db.relationship("Purse", back_populates="user", lazy="raise")
 
     def birth_date_str(self):
         """
@@ -72,7 +89,7 @@ class User(db.Model):
 
         """
 
-        return self.birth_date.strftime("%Y-%m-%d")
+        return date_str(self.birth_date)
 
     def date_created_str(self):
         """
@@ -83,7 +100,7 @@ class User(db.Model):
 
         """
 
-        return self.date_created.strftime("%Y-%m-%d %H:%M:%S")
+        return datetime_str(self.date_created)
 
     def date_modified_str(self):
         """
@@ -94,7 +111,7 @@ class User(db.Model):
 
         """
 
-        return self.date_modified.strftime("%Y-%m-%d %H:%M:%S")
+        return datetime_str(self.date_modified)
 
     def __repr__(self):
         """
@@ -105,10 +122,10 @@ class User(db.Model):
 
         """
 
-        return f"User id: {self.id}, \
-            name: {self.username}, \
-            email: {self.email}, \
-            phone: {self.phone}"
+        return (
+            f"User(id={self.id}, username={self.username}, "
+            f"email={self.email}, phone={self.phone})"
+        )
 
     def to_dict(self):
         """
@@ -126,30 +143,85 @@ class User(db.Model):
             "phone": self.phone,
             "first_name": self.first_name,
             "last_name": self.last_name,
-            "birth_date": self.birth_date_str(),
-            "date_created": self.date_created_str(),
-            "date_modified": self.date_modified_str(),
+            "birth_date": date_str(self.birth_date),
+            "date_created": datetime_str(self.date_created),
+            "date_modified": datetime_str(self.date_modified),
         }
 
+    @classmethod
+    def to_dicts(cls, limit=None, offset=0):
+        """
+        Returns dictionary representations of the User objects ordered by id, in the to_dict
+        format. Only the needed columns are selected and no User objects are built.
+
+        Parameters:
+            - limit (int, optional): The maximum number of rows to return. Defaults to all rows.
+            - offset (int, optional): The number of rows to skip. Defaults to 0.
+
+        Returns:
+            - list: A list of dictionaries representing the User objects.
+
+        """
+
+        rows = db.session.execute(
+            db.select(
+                cls.id,
+                cls.username,
+                cls.email,
+                cls.phone,
+                cls.first_name,
+                cls.last_name,
+                cls.birth_date,
+                cls.date_created,
+                cls.date_modified,
+            )
+            .order_by(cls.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        return [
+            {
+                "id": row.id,
+                "username": row.username,
+                "email": row.email,
+                "phone": row.phone,
+                "first_name": row.first_name,
+                "last_name": row.last_name,
+                "birth_date": date_str(row.birth_date),
+                "date_created": datetime_str(row.date_created),
+                "date_modified": datetime_str(row.date_modified),
+            }
+            for row in rows
+        ]
+
     def update(self, **kwargs):
         """
-        Updates the User object with the given keyword arguments. The birth_date attribute
-        is converted to a datetime.date object and the date_created and date_modified
-        attributes are removed from the dictionary.
+        Updates the User object with the given keyword arguments. Only the attributes listed
+        in _UPDATABLE_FIELDS and birth_date are assigned, so date_created, date_modified and any
+        other keys are ignored. The birth_date attribute is converted to a datetime.date object.
 
         Parameters:
             - **kwargs: Keyword arguments to update the User object with.
 
         """
 
+        for key in _UPDATABLE_FIELDS:
+            if key in kwargs:
+                setattr(self, key, kwargs[key])
+
         if "birth_date" in kwargs:
-            kwargs["birth_date"] = datetime.strptime(kwargs["birth_date"], "%Y-%m-%d")
+            self.birth_date = date.fromisoformat(kwargs["birth_date"])
 
-        if "date_created" in kwargs:
-            kwargs.pop("date_created")
+    @classmethod
+    def bulk_insert(cls, rows):
+        """
+        Inserts many users in a single executemany INSERT statement, without building an ORM
+        object for each row. Column defaults are still applied. Nothing is committed here.
 
-        if "date_modified" in kwargs:
-            kwargs.pop("date_modified")
+        Parameters:
+            - rows (list): A list of dictionaries with the column values of each user.
+
+        """
 
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+        if rows:
+            db.session.execute(db.insert(cls), rows)
@@ -9,8 +9,10 @@ Dependencies:
     - flask_restful
     - app.db
     - app.constants.currency
+    - app.constants.pagination
     - app.models.users
     - app.models.purses
+    - app.utils.cache
 
 Exported classes:
     - PursesAPI
@@ -25,12 +27,16 @@ Functions:
 
 import logging
 
-from flask_restful import Resource, abort, reqparse
+from flask_restful import Resource, abort, inputs, reqparse
 
 from app import db
-from app.constants.currency import Currency
+from app.constants.currency import CURRENCY_BY_CODE
+from app.constants.pagination import MAX_PER_PAGE
 from app.models.purses import Purse
 from app.models.users import User
+from app.utils.cache import cached_get
+
+PER_PAGE = 100
 
 
 def _get_purse_or_abort_if_doesnt_exist(_id):
@@ -68,17 +74,18 @@ def _validate_args(args):
 
     """
 
-    if (
-        User.query.filter_by(id=args["user_id"]).first() is None
-        or not User.query.filter_by(id=args["user_id"]).first().is_active
+    # The currency is checked in memory before the user is looked up in the database.
+    if args["currency"] not in CURRENCY_BY_CODE:
+        logging.error("Currency %s is not valid.", args["currency"])
+        abort(400, message=f"Currency {args['currency']} is not valid.")
+
+    # Only the is_active column is selected: None if the user doesn't exist.
+    if not db.session.scalar(
+        db.select(User.is_active).where(User.id == args["user_id"])
     ):
         logging.error("User %s doesn't exist.", args["user_id"])
         abort(400, message=f"User {args['user_id']} doesn't exist.")
 
-    if args["currency"] not in Currency.__members__:
-        logging.error("Currency %s is not valid.", args["currency"])
-        abort(400, message=f"Currency {args['currency']} is not valid.")
-
     return True
 
 
@@ -99,6 +106,23 @@ parser.add_argument(
 )
 
 
+list_parser = reqparse.RequestParser()
+list_parser.add_argument(
+    "limit",
+    type=inputs.positive,
+    location="args",
+    default=PER_PAGE,
+    help="Limit must be a positive integer.",
+)
+list_parser.add_argument(
+    "offset",
+    type=inputs.natural,
+    location="args",
+    default=0,
+    help="Offset must be a non-negative integer.",
+)
+
+
 class PursesAPI(Resource):
     """
     Resource for retrieving and deleting a purse.
@@ -109,6 +133,7 @@ class PursesAPI(Resource):
 
     """
 
+    @cached_get
     def get(self, _id):
         """
         Returns the JSON representation of a purse with the given _id.
@@ -121,8 +146,9 @@ class PursesAPI(Resource):
 
         """
         purse = _get_purse_or_abort_if_doesnt_exist(_id)
-        logging.info("Retrieved purse %s. Details: %s.", _id, purse.to_dict())
-        return purse.to_dict()
+        purse_dict = purse.to_dict()
+        logging.info("Retrieved purse %s. Details: %s.", _id, purse_dict)
+        return purse_dict
 
     def delete(self, _id):
         """
@@ -158,16 +184,18 @@ class PursesListAPI(Resource):
 
     def get(self):
         """
-        Returns a list of all purses in the database.
+        Returns a page of the purses in the database ordered by id. The page is selected with
+        the limit (PER_PAGE by default, MAX_PER_PAGE at most) and offset query parameters.
 
         Returns:
             - purses_list (list): A list of dictionaries containing the details of each purse.
 
         """
 
-        purses = Purse.query.all()
-        logging.info("Retrieved all purses. Count: %s.", len(purses))
-        return [purse.to_dict() for purse in purses]
+        args = list_parser.parse_args()
+        purses = Purse.to_dicts(min(args["limit"], MAX_PER_PAGE), args["offset"])
+        logging.info("Retrieved purses. Count: %s.", len(purses))
+        return purses
 
     def post(self):
         """
@@ -184,5 +212,6 @@ class PursesListAPI(Resource):
         purse = Purse(user_id=args["user_id"], currency=args["currency"])
         db.session.add(purse)
         db.session.commit()
-        logging.info("Created new purse %s. Details: %s.", purse.id, purse.to_dict())
-        return purse.to_dict(), 201
+        purse_dict = purse.to_dict()
+        logging.info("Created new purse %s. Details: %s.", purse.id, purse_dict)
+        return purse_dict, 201
@@ -7,29 +7,48 @@ and creating a new transaction.
 
 Dependencies:
     - logging
+    - math
+    - flask
     - flask_restful
     - app.db
+    - app.constants.pagination
+    - app.constants.rates
     - app.models.purses
     - app.models.transactions
+    - app.utils.cache
 
 Exported classes:
     - TransactionsAPI
     - TransactionsListAPI
+    - TransactionsBulkAPI
 
 Functions:
     - _get_transaction_or_abort_if_doesnt_exist: Retrieves a transaction with the given id
     from the database or aborts the request with a 404 error if it doesn't exist.
+    - _validate_purses: Validates the purses of a transaction against the fetched purses.
+    - _get_purses: Retrieves the purses with the given ids with a single query.
     - _validate_args: Validates the arguments of a request.
+    - _parse_bulk_args: Parses the JSON body of a bulk request.
 
 """
 
 import logging
+import math
 
-from flask_restful import Resource, abort, reqparse
+from flask import request
+from flask_restful import Resource, abort, inputs, reqparse
 
 from app import db
+from app.constants.pagination import MAX_PER_PAGE
+from app.constants.rates import Rates
 from app.models.purses import Purse
-from app.models.transactions import Transaction
+from app.models.transactions import InsufficientFunds, Transaction
+from app.utils.cache import cached_get
+
+PER_PAGE = 100
+# Sums of float amounts can miss the exact balance by a rounding error, so a purse drained
+# exactly may come out a hair below zero; balances are compared within this tolerance.
+BALANCE_TOLERANCE = 1e-9
 
 
 def _get_transaction_or_abort_if_doesnt_exist(_id):
@@ -55,36 +74,22 @@ def _get_transaction_or_abort_if_doesnt_exist(_id):
     return transaction
 
 
-def _validate_args(args):
+def _validate_purses(args, purses, balances):
     """
-    Validates the arguments of a request.
+    Validates the purses of a transaction against the already fetched purses.
 
     Args:
-        - args (dict): The arguments of the request.
+        - args (dict): The arguments of the transaction.
+        - purses (dict): The fetched purses by id.
+        - balances (dict): The balances to check against by purse id, for the purses whose
+        balance differs from the fetched one. Other purses are checked against their balance.
 
     Returns:
-        - True if the arguments are valid, False otherwise.
+        - purse_from (Purse), purse_to (Purse): The purses of the transaction.
 
     """
 
-    if (
-        Purse.query.filter_by(id=args["purse_from_id"]).first() is None
-        or not Purse.query.filter_by(id=args["purse_from_id"]).first().is_active
-    ):
-        logging.error("Purse %s doesn't exist.", args["purse_from_id"])
-        abort(400, message=f"Purse {args['purse_from_id']} doesn't exist.")
-
-    if (
-        Purse.query.filter_by(id=args["purse_to_id"]).first() is None
-        or not Purse.query.filter_by(id=args["purse_to_id"]).first().is_active
-    ):
-        logging.error("Purse %s doesn't exist.", args["purse_to_id"])
-        abort(400, message=f"Purse {args['purse_to_id']} doesn't exist.")
-
-    if (
-        Purse.query.filter_by(id=args["purse_from_id"]).first()
-        == Purse.query.filter_by(id=args["purse_to_id"]).first()
-    ):
+    if args["purse_from_id"] == args["purse_to_id"]:
         logging.error(
             "Purse %s and purse %s are the same.",
             args["purse_from_id"],
@@ -95,14 +100,105 @@ def _validate_args(args):
             message=f"Purse {args['purse_from_id']} and purse {args['purse_to_id']} are the same.",
         )
 
-    if (
-        Purse.query.filter_by(id=args["purse_from_id"]).first().balance
-        < args["purse_from_amount"]
-    ):
+    purse_from = purses.get(args["purse_from_id"])
+    if purse_from is None or not purse_from.is_active:
+        logging.error("Purse %s doesn't exist.", args["purse_from_id"])
+        abort(400, message=f"Purse {args['purse_from_id']} doesn't exist.")
+
+    purse_to = purses.get(args["purse_to_id"])
+    if purse_to is None or not purse_to.is_active:
+        logging.error("Purse %s doesn't exist.", args["purse_to_id"])
+        abort(400, message=f"Purse {args['purse_to_id']} doesn't exist.")
+
+    balance = balances.get(purse_from.id, purse_from.balance)
+    if balance + BALANCE_TOLERANCE < args["purse_from_amount"]:
         logging.error("Purse %s doesn't have enough money.", args["purse_from_id"])
         abort(400, message=f"Purse {args['purse_from_id']} doesn't have enough money.")
 
-    return True
+    return purse_from, purse_to
+
+
+def _get_purses(purse_ids):
+    """
+    Retrieves the purses with the given ids from the database with a single query.
+
+    Args:
+        - purse_ids (iterable): The ids of the purses to retrieve.
+
+    Returns:
+        - purses (dict): The retrieved purses by id.
+
+    """
+
+    purses = db.session.scalars(db.select(Purse).where(Purse.id.in_(purse_ids)))
+    return {purse.id: purse for purse in purses}
+
+
+def _validate_args(args):
+    """
+    Validates the arguments of a request. Both purses are fetched with a single query
+    and all the checks run on the fetched objects.
+
+    Args:
+        - args (dict): The arguments of the request.
+
+    Returns:
+        - purse_from (Purse), purse_to (Purse): The purses of the transaction.
+
+    """
+
+    # Same-purse requests are rejected before querying.
+    if args["purse_from_id"] == args["purse_to_id"]:
+        return _validate_purses(args, {}, {})
+    purses = _get_purses((args["purse_from_id"], args["purse_to_id"]))
+    return _validate_purses(args, purses, {})
+
+
+def _parse_bulk_args(data):
+    """
+    Parses the JSON body of a bulk request into the arguments of each transaction.
+
+    Args:
+        - data: The decoded JSON body of the request.
+
+    Returns:
+        - args_list (list): A list of dicts with the arguments of each transaction.
+
+    Raises:
+        - 400 error: If the body isn't a non-empty list of transactions, or an amount isn't
+        a finite positive number.
+
+    """
+
+    if not isinstance(data, list) or not data:
+        logging.error("Bulk transactions body is not a non-empty list.")
+        abort(400, message="A non-empty list of transactions is required.")
+    args_list = []
+    try:
+        for item in data:
+            # float() would take true and false as 1 and 0.
+            if isinstance(item["purse_from_amount"], bool):
+                raise TypeError
+            args_list.append(
+                {
+                    "purse_from_id": int(item["purse_from_id"]),
+                    "purse_to_id": int(item["purse_to_id"]),
+                    "purse_from_amount": float(item["purse_from_amount"]),
+                }
+            )
+    except (KeyError, TypeError, ValueError):
+        logging.error("Bulk transactions body has an invalid transaction.")
+        abort(
+            400,
+            message="Each transaction requires purse_from_id, purse_to_id and purse_from_amount.",
+        )
+
+    for args in args_list:
+        amount = args["purse_from_amount"]
+        if not (math.isfinite(amount) and amount > 0):
+            logging.error("Amount %s is not a positive number.", amount)
+            abort(400, message=f"Amount {amount} is not a positive number.")
+    return args_list
 
 
 parser = reqparse.RequestParser()
@@ -129,6 +225,29 @@ parser.add_argument(
 )
 
 
+list_parser = reqparse.RequestParser()
+list_parser.add_argument(
+    "limit",
+    type=inputs.positive,
+    location="args",
+    default=PER_PAGE,
+    help="Limit must be a positive integer.",
+)
+list_parser.add_argument(
+    "offset",
+    type=inputs.natural,
+    location="args",
+    default=0,
+    help="Offset must be a non-negative integer.",
+)
+list_parser.add_argument(
+    "after_id",
+    type=inputs.natural,
+    location="args",
+    help="After id must be a non-negative integer.",
+)
+
+
 class TransactionsAPI(Resource):
     """
     Resource for retrieving and deleting a transaction.
@@ -138,6 +257,7 @@ class TransactionsAPI(Resource):
 
     """
 
+    @cached_get
     def get(self, _id):
         """
         Returns the JSON representation of a transaction with the given _id.
@@ -151,10 +271,9 @@ class TransactionsAPI(Resource):
         """
 
         transaction = _get_transaction_or_abort_if_doesnt_exist(_id)
-        logging.info(
-            "Retrieved transaction %s. Details: %s", _id, transaction.to_dict()
-        )
-        return transaction.to_dict()
+        transaction_dict = transaction.to_dict()
+        logging.info("Retrieved transaction %s. Details: %s", _id, transaction_dict)
+        return transaction_dict
 
 
 class TransactionsListAPI(Resource):
@@ -172,7 +291,10 @@ class TransactionsListAPI(Resource):
 
     def get(self):
         """
-        Returns a list of all transactions in the database.
+        Returns a page of the transactions in the database ordered by id. The page is selected
+        with the limit (PER_PAGE by default, MAX_PER_PAGE at most) and offset query parameters.
+        The after_id parameter continues from the last id of the previous page without
+        scanning the skipped rows.
 
         Returns:
             - transactions_list (list): A list of dictionaries containing
@@ -180,9 +302,12 @@ class TransactionsListAPI(Resource):
 
         """
 
-        transactions = Transaction.query.all()
-        logging.info("Retrieved all transactions. Count: %s", len(transactions))
-        return [transaction.to_dict() for transaction in transactions]
+        args = list_parser.parse_args()
+        transactions = Transaction.to_dicts(
+            min(args["limit"], MAX_PER_PAGE), args["offset"], args["after_id"]
+        )
+        logging.info("Retrieved transactions. Count: %s", len(transactions))
+        return transactions
 
     def post(self):
         """
@@ -196,12 +321,97 @@ class TransactionsListAPI(Resource):
         """
 
         args = parser.parse_args()
-        _validate_args(args)
+        purse_from, purse_to = _validate_args(args)
         transaction = Transaction()
-        transaction.update(**args)
+        try:
+            transaction.update(purse_from=purse_from, purse_to=purse_to, **args)
+        except InsufficientFunds as error:
+            db.session.rollback()
+            logging.error(str(error))
+            abort(400, message=str(error))
         db.session.add(transaction)
         db.session.commit()
+        transaction_dict = transaction.to_dict()
         logging.info(
-            "Created transaction %s. Details: %s", transaction.id, transaction.to_dict()
+            "Created transaction %s. Details: %s", transaction.id, transaction_dict
         )
-        return transaction.to_dict(), 201
+        return transaction_dict, 201
+
+
+class TransactionsBulkAPI(Resource):
+    """
+    Resource for creating many transactions in one request.
+
+    Methods:
+        - post: Creates the transactions listed in the JSON body of the request.
+
+    """
+
+    def post(self):
+        """
+        Creates the transactions listed in the JSON body of the request, which is a list of
+        objects with purse_from_id, purse_to_id and purse_from_amount. The purses are fetched
+        with a single query, the balance of each purse is changed with a single UPDATE, and
+        the transactions are inserted with a single INSERT. Either all the transactions are
+        created or none of them.
+
+        Returns:
+            - message (dict): A message with the number of created transactions.
+            - 201 status code: Indicates that the resources were successfully created.
+
+        """
+
+        args_list = _parse_bulk_args(request.get_json(silent=True))
+        purses = _get_purses(
+            {args["purse_from_id"] for args in args_list}
+            | {args["purse_to_id"] for args in args_list}
+        )
+
+        balances = {}
+        rows = []
+        for args in args_list:
+            purse_from, purse_to = _validate_purses(args, purses, balances)
+            purse_to_amount = args["purse_from_amount"]
+            if purse_from.currency != purse_to.currency:
+                purse_to_amount *= Rates.get_rate(
+                    purse_from.currency, purse_to.currency
+                )
+            balances[purse_from.id] = (
+                balances.get(purse_from.id, purse_from.balance)
+                - args["purse_from_amount"]
+            )
+            balances[purse_to.id] = (
+                balances.get(purse_to.id, purse_to.balance) + purse_to_amount
+            )
+            rows.append(
+                {
+                    "purse_from_id": purse_from.id,
+                    "purse_to_id": purse_to.id,
+                    "purse_from_currency": purse_from.currency,
+                    "purse_to_currency": purse_to.currency,
+                    "purse_from_amount": args["purse_from_amount"],
+                    "purse_to_amount": purse_to_amount,
+                }
+            )
+
+        # Each purse gets its net change in one UPDATE; the balance condition keeps a
+        # concurrent transfer from overdrawing it between the checks above and the write.
+        for purse_id, balance in balances.items():
+            change = balance - purses[purse_id].balance
+            updated = db.session.execute(
+                db.update(Purse)
+                .where(
+                    Purse.id == purse_id,
+                    Purse.balance + change >= -BALANCE_TOLERANCE,
+                )
+                .values(balance=Purse.balance + change)
+            )
+            if updated.rowcount == 0:
+                db.session.rollback()
+                logging.error("Purse %s doesn't have enough money.", purse_id)
+                abort(400, message=f"Purse {purse_id} doesn't have enough money.")
+
+        Transaction.bulk_insert(rows)
+        db.session.commit()
+        logging.info("Created %s transactions.", len(rows))
+        return {"message": f"Created {len(rows)} transactions."}, 201
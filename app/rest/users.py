@@ -5,11 +5,15 @@ deleting a user, updating a user, retrieving a list of all users, and creating a
 
 Dependencies:
     - logging
+    - re
     - datetime
     - flask_restful
+    - sqlalchemy.exc
+    - werkzeug.exceptions
     - app.db
     - app.models.purses
     - app.models.users
+    - app.utils.cache
     - app.utils.validation
 
 Exported classes:
@@ -20,18 +24,27 @@ Functions:
     - _get_user_or_abort_if_doesnt_exist: Retrieves a user with the given id from the database or
     aborts the request with a 404 error if it doesn't exist.
     - _validate_args: Validates the arguments of a request.
+    - _abort_if_not_unique: Aborts the request with a 400 error if the username, email or phone
+    is already taken.
+    - _unique_violation_field: Finds the user column whose unique constraint was violated.
+    - _commit_or_abort_if_not_unique: Commits the session or aborts the request with a 400 error
+    if the username, email or phone is already taken.
 
 """
 
 import logging
-from datetime import datetime
+import re
+from datetime import date
 
 from flask_restful import Resource, abort, reqparse
+from sqlalchemy.exc import IntegrityError
+from werkzeug.exceptions import HTTPException
 
 from app import db
 from app.models.purses import Purse
 from app.models.users import User
-from app.utils.validation import is_valid_date, is_valid_email, is_valid_phone_number
+from app.utils.cache import cached_get
+from app.utils.validation import is_valid_email, is_valid_phone_number
 
 
 def _get_user_or_abort_if_doesnt_exist(_id):
@@ -59,7 +72,8 @@ def _get_user_or_abort_if_doesnt_exist(_id):
 
 def _validate_args(args):
     """
-    Validates the arguments of a request.
+    Validates the arguments of a request. The birth_date argument is parsed into a date once,
+    which both validates it and converts it for the model.
 
     Args:
         - args (dict): The arguments of the request.
@@ -69,19 +83,9 @@ def _validate_args(args):
 
     """
 
-    if User.query.filter_by(username=args["username"]).first():
-        logging.error("Username %s already exists.", args["username"])
-        abort(400, message=f"Username {args['username']} already exists.")
-
-    if User.query.filter_by(email=args["email"]).first():
-        logging.error("Email %s already exists.", args["email"])
-        abort(400, message=f"Email {args['email']} already exists.")
-
-    if User.query.filter_by(phone=args["phone"]).first():
-        logging.error("Phone %s already exists.", args["phone"])
-        abort(400, message=f"Phone {args['phone']} already exists.")
-
-    if is_valid_date(args["birth_date"]) is False:
+    try:
+        birth_date = date.fromisoformat(args["birth_date"])
+    except (TypeError, ValueError):
         logging.error("Birth date %s is not valid.", args["birth_date"])
         abort(400, message=f"Birth date {args['birth_date']} is not valid.")
 
@@ -93,96 +97,126 @@ def _validate_args(args):
         logging.error("Email %s is not valid.", args["email"])
         abort(400, message=f"Email {args['email']} is not valid.")
 
+    args["birth_date"] = birth_date
     return True
 
 
-post_parser = reqparse.RequestParser()
-post_parser.add_argument(
-    "username",
-    type=str,
-    location="form",
-    required=True,
-    help="Username is required.",
-)
-post_parser.add_argument(
-    "email",
-    type=str,
-    location="form",
-    required=True,
-    help="Email is required.",
-)
-post_parser.add_argument(
-    "phone",
-    type=str,
-    location="form",
-    required=True,
-    help="Phone is required.",
-)
-post_parser.add_argument(
-    "first_name",
-    type=str,
-    location="form",
-    required=True,
-    help="First name is required.",
-)
-post_parser.add_argument(
-    "last_name",
-    type=str,
-    location="form",
-    required=True,
-    help="Last name is required.",
-)
-post_parser.add_argument(
-    "birth_date",
-    type=str,
-    location="form",
-    required=True,
-    help="Birth date is required.",
+def _abort_if_not_unique(args):
+    """
+    Aborts the request with a 400 error if the username, email or phone already belongs to
+    a user. A single query finds every user clashing on any of the three fields.
+
+    Args:
+        - args (dict): The arguments of the request.
+
+    """
+
+    clashes = db.session.execute(
+        db.select(User.username, User.email, User.phone).where(
+            db.or_(
+                User.username == args["username"],
+                User.email == args["email"],
+                User.phone == args["phone"],
+            )
+        )
+    ).all()
+
+    if any(clash.username == args["username"] for clash in clashes):
+        logging.error("Username %s already exists.", args["username"])
+        abort(400, message=f"Username {args['username']} already exists.")
+
+    if any(clash.email == args["email"] for clash in clashes):
+        logging.error("Email %s already exists.", args["email"])
+        abort(400, message=f"Email {args['email']} already exists.")
+
+    if any(clash.phone == args["phone"] for clash in clashes):
+        logging.error("Phone %s already exists.", args["phone"])
+        abort(400, message=f"Phone {args['phone']} already exists.")
+
+
+# The label used in the error message of each unique user column
+_UNIQUE_FIELD_LABELS = {"username": "Username", "email": "Email", "phone": "Phone"}
+
+# The message of SQLite for a violated unique constraint, naming the table and the column
+_SQLITE_UNIQUE_RE = re.compile(r"UNIQUE constraint failed: (\w+)\.(\w+)")
+
+
+def _unique_violation_field(error):
+    """
+    Finds the user column whose unique constraint was violated. The column is read from the
+    constraint name reported by PostgreSQL, or from the table and column named in the SQLite
+    message, never from the rest of the message, which may quote the offending values.
+
+    Args:
+        - error (IntegrityError): The error raised by the commit.
+
+    Returns:
+        - str: The name of the column, or None if it can't be determined.
+
+    """
+
+    constraint_name = getattr(
+        getattr(error.orig, "diag", None), "constraint_name", None
+    )
+    if constraint_name:
+        for field in _UNIQUE_FIELD_LABELS:
+            # The default PostgreSQL name of a single-column unique constraint
+            if constraint_name == f"{User.__tablename__}_{field}_key":
+                return field
+        return None
+
+    match = _SQLITE_UNIQUE_RE.search(str(error.orig))
+    if match and match.group(1) == User.__tablename__:
+        return match.group(2)
+    return None
+
+
+def _commit_or_abort_if_not_unique(args):
+    """
+    Commits the session. The uniqueness of the username, email and phone is enforced by the
+    database, so a duplicate is caught here instead of being looked up before the write.
+
+    Args:
+        - args (dict): The arguments of the request.
+
+    Raises:
+        - 400 error: If the username, email or phone already belongs to another user, or the
+        user violates another database constraint.
+
+    """
+
+    try:
+        db.session.commit()
+    except IntegrityError as error:
+        db.session.rollback()
+        field = _unique_violation_field(error)
+        if field in _UNIQUE_FIELD_LABELS:
+            label = _UNIQUE_FIELD_LABELS[field]
+            logging.error("%s %s already exists.", label, args[field])
+            abort(400, message=f"{label} {args[field]} already exists.")
+        logging.error("User %s violates a database constraint.", args["username"])
+        abort(400, message="The user violates a database constraint.")
+
+
+# The name and the help message of each user field, shared by the POST and PUT parsers
+_USER_FIELDS = (
+    ("username", "Username is required."),
+    ("email", "Email is required."),
+    ("phone", "Phone is required."),
+    ("first_name", "First name is required."),
+    ("last_name", "Last name is required."),
+    ("birth_date", "Birth date is required."),
 )
 
+post_parser = reqparse.RequestParser()
 put_parser = reqparse.RequestParser()
-put_parser.add_argument(
-    "username",
-    type=str,
-    location="form",
-    required=False,
-    help="Username is required.",
-)
-put_parser.add_argument(
-    "email",
-    type=str,
-    location="form",
-    required=False,
-    help="Email is required.",
-)
-put_parser.add_argument(
-    "phone",
-    type=str,
-    location="form",
-    required=False,
-    help="Phone is required.",
-)
-put_parser.add_argument(
-    "first_name",
-    type=str,
-    location="form",
-    required=False,
-    help="First name is required.",
-)
-put_parser.add_argument(
-    "last_name",
-    type=str,
-    location="form",
-    required=False,
-    help="Last name is required.",
-)
-put_parser.add_argument(
-    "birth_date",
-    type=str,
-    location="form",
-    required=False,
-    help="Birth date is required.",
-)
+for _name, _help in _USER_FIELDS:
+    post_parser.add_argument(
+        _name, type=str, location="form", required=True, help=_help
+    )
+    put_parser.add_argument(
+        _name, type=str, location="form", required=False, help=_help
+    )
 
 
 class UsersAPI(Resource):
@@ -196,6 +230,7 @@ class UsersAPI(Resource):
 
     """
 
+    @cached_get
     def get(self, _id):
         """
         Returns the JSON representation of a user with the given _id.
@@ -209,8 +244,9 @@ class UsersAPI(Resource):
         """
 
         user = _get_user_or_abort_if_doesnt_exist(_id)
-        logging.info("Retrieved user %s. Details: %s.", _id, user.to_dict())
-        return user.to_dict()
+        user_dict = user.to_dict()
+        logging.info("Retrieved user %s. Details: %s.", _id, user_dict)
+        return user_dict
 
     def delete(self, _id):
         """
@@ -225,13 +261,12 @@ class UsersAPI(Resource):
         """
 
         user = _get_user_or_abort_if_doesnt_exist(_id)
-        purses = Purse.query.filter_by(user_id=_id).all()
         user.is_active = False
         logging.info("Deleted user %s. Deleting user's purses.", _id)
-        for purse in purses:
-            purse.is_active = False
-            logging.info("Deleted purse %s.", purse.id)
-        logging.info("Deleted user %s's purses.", _id)
+        purses = db.session.execute(
+            db.update(Purse).where(Purse.user_id == _id).values(is_active=False)
+        )
+        logging.info("Deleted %s purses for user %s.", purses.rowcount, _id)
         db.session.commit()
         return "", 204
 
@@ -248,19 +283,29 @@ class UsersAPI(Resource):
 
         """
 
-        user = _get_user_or_abort_if_doesnt_exist(_id)
-        args = put_parser.parse_args()
-        _validate_args(args)
-        args["birth_date"] = datetime.strptime(args["birth_date"], "%Y-%m-%d")
-        logging.info(
-            "Updating user %s. Old values: {user.to_dict()}. New values: %s.",
-            _id,
-            args,
+        try:
+            args = put_parser.parse_args()
+            _validate_args(args)
+            _abort_if_not_unique(args)
+        except HTTPException:
+            # A missing user is reported before an invalid body; the lookup only runs on
+            # this error path, so a valid update doesn't pay for it.
+            _get_user_or_abort_if_doesnt_exist(_id)
+            raise
+        logging.info("Updating user %s. New values: %s.", _id, args)
+        # The UPDATE matches no row if the user doesn't exist, so it also serves as the
+        # existence check; the user is loaded once afterwards, for the response only.
+        updated = db.session.execute(
+            db.update(User)
+            .where(User.id == _id, User.is_active)
+            .values(**{key: value for key, value in args.items() if value is not None})
         )
-        for key, value in args.items():
-            if value is not None:
-                setattr(user, key, value)
+        if updated.rowcount == 0:
+            db.session.rollback()
+            logging.error("user %s doesn't exist.", _id)
+            abort(404, message=f"user {_id} doesn't exist.")
         db.session.commit()
+        user = db.session.get(User, _id)
         return user.to_dict(), 201
 
 
@@ -286,9 +331,9 @@ class UsersListAPI(Resource):
 
         """
 
-        users = User.query.all()
+        users = User.to_dicts()
         logging.info("Retrieved all users. Count: %s.", len(users))
-        return [user.to_dict() for user in users]
+        return users
 
     def post(self):
         """
@@ -302,9 +347,9 @@ class UsersListAPI(Resource):
 
         args = post_parser.parse_args()
         _validate_args(args)
-        args["birth_date"] = datetime.strptime(args["birth_date"], "%Y-%m-%d")
         user = User(**args)
         db.session.add(user)
-        db.session.commit()
-        logging.info("Created new user %s. Details: %s.", user.id, user.to_dict())
-        return user.to_dict(), 201
+        _commit_or_abort_if_not_unique(args)
+        user_dict = user.to_dict()
+        logging.info("Created new user %s. Details: %s.", user.id, user_dict)
+        return user_dict, 201
@@ -2,7 +2,9 @@
 This module populates a database with fake data for testing and development purposes.
 
 Dependencies:
+    - collections
     - datetime
+    - itertools
     - random
     - Faker
     - app.constants.currency
@@ -12,15 +14,18 @@ Dependencies:
     - app.utils.validation
 
 Functions:
-    - _create_fake_users(db): creates and saves fake users to the database.
-    - _create_fake_purses(db): creates and saves fake purses to the database.
-    - _create_fake_transactions(db): creates and saves fake transactions to the database.
-    - populate_db(db): populates the database with fake data by calling the above three functions.
+    - _create_fake_users(db): inserts fake users into the database.
+    - _create_fake_purses(db): inserts fake purses into the database.
+    - _create_fake_transactions(db): inserts fake transactions into the database.
+    - populate_db(db): populates the database with fake data by calling the above three functions
+    and commits them at once.
 
 """
 
+from collections import defaultdict
 from datetime import datetime
-from random import randint
+from itertools import product
+from random import choice, randint
 
 from faker import Faker
 
@@ -35,93 +40,113 @@ fake = Faker()
 
 def _create_fake_users(_db):
     """
-    Create and save fake users to the database.
+    Insert fake users into the database. Nothing is committed here.
 
     Args:
         - _db (SQLAlchemy): database object.
 
     """
 
-    users = []
-    for _ in range(25):
-        user = User(
-            username=fake.user_name(),
-            email=fake.email(),
-            phone=fake_phone_number(),
-            first_name=fake.first_name(),
-            last_name=fake.last_name(),
-            birth_date=fake.date_of_birth(),
-            date_created=datetime.utcnow(),
-            date_modified=datetime.utcnow(),
-        )
-        users.append(user)
-    _db.session.add_all(users)
-    _db.session.commit()
+    now = datetime.utcnow()
+    users = [
+        {
+            "username": fake.user_name(),
+            "email": fake.email(),
+            "phone": fake_phone_number(),
+            "first_name": fake.first_name(),
+            "last_name": fake.last_name(),
+            "birth_date": fake.date_of_birth(),
+            "date_created": now,
+            "date_modified": now,
+        }
+        for _ in range(25)
+    ]
+    User.bulk_insert(users)
 
 
 def _create_fake_purses(_db):
     """
-    Create and save fake purses to the database.
+    Insert fake purses into the database, one per currency for each user. Only the user ids
+    are selected. Nothing is committed here.
 
     Args:
         - _db (SQLAlchemy): database object.
 
     """
 
-    purses = []
-    users = User.query.all()
-    for user in users:
-        for currency in Currency:
-            purse = Purse(
-                user_id=user.id,
-                currency=currency.value,
-                balance=randint(0, 1000),
-                date_created=datetime.utcnow(),
-                date_modified=datetime.utcnow(),
-            )
-            purses.append(purse)
-    _db.session.add_all(purses)
-    _db.session.commit()
+    now = datetime.utcnow()
+    user_ids = _db.session.scalars(_db.select(User.id)).all()
+    purses = [
+        {
+            "user_id": user_id,
+            "currency": currency,
+            "balance": randint(0, 1000),
+            "date_created": now,
+            "date_modified": now,
+        }
+        for user_id, currency in product(user_ids, Currency)
+    ]
+    Purse.bulk_insert(purses)
 
 
 def _create_fake_transactions(_db):
     """
-    Create and save fake transactions to the database.
+    Insert fake transactions into the database. Nothing is committed here.
 
     Args:
         - _db (SQLAlchemy): database object.
 
     """
 
+    # The purses are loaded once and sampled in memory instead of sorting the whole
+    # table by random() for every pick.
+    purses = _db.session.execute(
+        _db.select(Purse.id, Purse.user_id, Purse.currency, Purse.balance)
+    ).all()
+    if not purses:
+        return
+    purses_by_currency = defaultdict(list)
+    owners_by_currency = defaultdict(set)
+    for purse in purses:
+        purses_by_currency[purse.currency].append(purse)
+        owners_by_currency[purse.currency].add(purse.user_id)
+    # Rejection sampling only ends if another user owns a purse in the same currency,
+    # e.g. it would never end with a single user.
+    shared_currencies = {
+        currency for currency, owners in owners_by_currency.items() if len(owners) > 1
+    }
+
+    now = datetime.utcnow()
     transactions = []
     for _ in range(100):
-        purse_from = Purse.query.order_by(_db.func.random()).first()
-        purse_to = (
-            Purse.query.filter(
-                Purse.user_id != purse_from.user_id,
-                Purse.currency == purse_from.currency,
-            )
-            .order_by(_db.func.random())
-            .first()
-        )
+        purse_from = choice(purses)
+        if purse_from.currency not in shared_currencies:
+            continue
+        # Every user has a purse in each currency, so a purse of another user is usually
+        # found on the first draw without filtering the whole list.
+        candidates = purses_by_currency[purse_from.currency]
+        purse_to = choice(candidates)
+        while purse_to.user_id == purse_from.user_id:
+            purse_to = choice(candidates)
         amount = randint(0, purse_from.balance)
-        transaction = Transaction(
-            purse_from_id=purse_from.id,
-            purse_to_id=purse_to.id,
-            purse_from_currency=purse_from.currency,
-            purse_to_currency=purse_to.currency,
-            purse_from_amount=amount,
-            purse_to_amount=amount,
-            date_created=datetime.utcnow(),
+        transactions.append(
+            {
+                "purse_from_id": purse_from.id,
+                "purse_to_id": purse_to.id,
+                "purse_from_currency": purse_from.currency,
+                "purse_to_currency": purse_to.currency,
+                "purse_from_amount": amount,
+                "purse_to_amount": amount,
+                "date_created": now,
+            }
         )
-        transactions.append(transaction)
-    _db.session.add_all(transactions)
-    _db.session.commit()
+    Transaction.bulk_insert(transactions)
 
 
 def populate_db(_db):
     """
-    Populate the database with fake data.
+    Populate the database with fake data. The users, purses and transactions are written in
+    a single database transaction, committed once at the end.
 
     Args:
         - _db (SQLAlchemy): database object.
@@ -131,3 +156,4 @@ def populate_db(_db):
     _create_fake_users(_db)
     _create_fake_purses(_db)
     _create_fake_transactions(_db)
+    _db.session.commit()
@@ -2,7 +2,7 @@
 This module contains the tests for the purses API.
 
 Dependencies:
-    - faker
+    - app
     - app.constants.currency
     - app.models.purses
     - app.tests.fixtures
@@ -12,19 +12,17 @@ Classes:
 
 """
 
-from faker import Faker
-
+from app import db
 from app.constants.currency import Currency
 from app.models.purses import Purse
 from app.tests.fixtures import (  # noqa: F401 pylint: disable=unused-import
     fixture_app,
     fixture_client,
     fixture_purse,
+    fixture_purses,
     fixture_user,
 )
 
-fake = Faker()
-
 
 class TestPursesAPI:
     """
@@ -32,6 +30,9 @@ class TestPursesAPI:
 
     Methods:
         - test_get_purses(client, purse): tests the retrieval of all purses.
+        - test_get_purses_page(client, purses): tests the retrieval of a page of purses.
+        - test_get_purses_page_limit(client, purses, monkeypatch): tests that the page limit
+        is capped.
         - test_get_purse(client, purse): tests the retrieval of a purse with a given
         - test_get_nonexistent_purse(client): tests the retrieval of a nonexistent purse.
         - test_delete_purse(client, purse): tests the deletion of a purse with a given
@@ -62,6 +63,39 @@ class TestPursesAPI:
         assert response.json[0]["currency"] == Currency(purse.currency).value
         assert response.json[0]["balance"] == purse.balance
 
+    def test_get_purses_page(self, client, purses):
+        """
+        Test retrieving a page of purses with the limit and offset query parameters.
+
+        Args:
+            - client: The test client.
+            - purses: The list of purse instances.
+
+        """
+
+        response = client.get("/api/purses/?limit=1&offset=1")
+        assert response.status_code == 200
+        assert [purse["id"] for purse in response.json] == [purses[1].id]
+
+        response = client.get("/api/purses/?limit=0")
+        assert response.status_code == 400
+
+    def test_get_purses_page_limit(self, client, purses, monkeypatch):
+        """
+        Test that the limit of a page of purses is capped at MAX_PER_PAGE.
+
+        Args:
+            - client: The test client.
+            - purses: The list of purse instances.
+            - monkeypatch: The pytest monkeypatch fixture.
+
+        """
+
+        monkeypatch.setattr("app.rest.purses.MAX_PER_PAGE", 1)
+        response = client.get("/api/purses/?limit=10000000")
+        assert response.status_code == 200
+        assert [purse["id"] for purse in response.json] == [purses[0].id]
+
     def test_get_purse(self, client, purse):
         """
         Test retrieving a purse with a given ID.
@@ -103,8 +137,8 @@ class TestPursesAPI:
 
         response = client.delete(f"/api/purses/{purse.id}")
         assert response.status_code == 204
-        assert Purse.query.filter_by(id=purse.id).count() == 1
-        assert Purse.query.filter_by(id=purse.id).first().is_active is False
+        row = db.session.get(Purse, purse.id)
+        assert row is not None and row.is_active is False
 
     def test_delete_nonexistent_purse(self, client):
         """
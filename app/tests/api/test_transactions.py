@@ -2,8 +2,11 @@
 This module contains the tests for the transactions API.
 
 Dependencies:
-    - faker
+    - app
     - app.constants.currency
+    - app.constants.rates
+    - app.models.purses
+    - app.models.transactions
     - app.models.api.fixtures
 
 Classes:
@@ -11,9 +14,11 @@ Classes:
 
 """
 
-from faker import Faker
-
+from app import db
 from app.constants.currency import Currency
+from app.constants.rates import Rates
+from app.models.purses import Purse
+from app.models.transactions import InsufficientFunds, Transaction
 from app.tests.fixtures import (  # noqa: F401 pylint: disable=unused-import
     fixture_app,
     fixture_client,
@@ -23,8 +28,6 @@ from app.tests.fixtures import (  # noqa: F401 pylint: disable=unused-import
     fixture_user,
 )
 
-fake = Faker()
-
 
 class TestTransactionsAPI:
     """
@@ -32,6 +35,8 @@ class TestTransactionsAPI:
 
     Methods:
         - test_get_transactions(client, transactions): tests the retrieval of all transactions.
+        - test_get_transactions_after_id(client, transaction): tests the retrieval of the
+        transactions following a given id.
         - test_get_transaction(client, transactions): tests the retrieval of a transaction.
         - test_get_nonexistent_transaction(client): tests the retrieval of a
         nonexistent transaction.
@@ -45,8 +50,20 @@ class TestTransactionsAPI:
         transaction with an invalid purse_to.
         - test_post_transaction_not_enough_funds(client): tests the creation of a
         transaction with not enough funds.
+        - test_post_transaction_overdrawn_on_write(client, purses, monkeypatch): tests a purse
+        overdrawn between the validation and the write.
         - test_post_transaction_same_purse(client): tests the creation of a
         transaction with the same purse_from and purse_to.
+        - test_post_transactions_bulk(client, purses): tests the creation of many
+        transactions in one request.
+        - test_post_transactions_bulk_drain_purse(client, purses): tests that a bulk request
+        draining a purse exactly is accepted.
+        - test_post_transactions_bulk_not_enough_funds(client, purses): tests that a bulk
+        request overdrawing a purse creates no transactions.
+        - test_post_transactions_bulk_invalid_body(client): tests a bulk request with an
+        invalid body.
+        - test_post_transactions_bulk_invalid_amount(client, purses): tests a bulk request with
+        a negative, zero, boolean or NaN amount.
 
     """
 
@@ -235,6 +252,35 @@ class TestTransactionsAPI:
         response = client.post("/api/transactions/", data=data)
         assert response.status_code == 400
 
+    def test_post_transaction_overdrawn_on_write(self, client, purses, monkeypatch):
+        """
+        Test that a purse overdrawn between the validation and the write gives a 400 error.
+
+        Args:
+            - client: The test client.
+            - purses: The list of purses.
+            - monkeypatch: The pytest monkeypatch fixture.
+
+        """
+
+        def update(_transaction, **kwargs):
+            raise InsufficientFunds(kwargs["purse_from_id"])
+
+        monkeypatch.setattr(Transaction, "update", update)
+        count = Transaction.query.count()
+        data = {
+            "purse_from_id": purses[0].id,
+            "purse_to_id": purses[1].id,
+            "purse_from_amount": 100,
+        }
+
+        response = client.post("/api/transactions/", data=data)
+        assert response.status_code == 400
+        assert response.json["message"] == (
+            f"Purse {purses[0].id} doesn't have enough money."
+        )
+        assert Transaction.query.count() == count
+
     def test_post_transaction_same_purse(self, client, purse):
         """
         Test creating a new transaction with the same purse.
@@ -253,3 +299,151 @@ class TestTransactionsAPI:
 
         response = client.post("/api/transactions/", data=data)
         assert response.status_code == 400
+
+    def test_post_transactions_bulk(self, client, purses):
+        """
+        Test creating many transactions in one request.
+
+        Args:
+            - client: The test client.
+            - purses: The list of purses.
+
+        """
+
+        data = [
+            {
+                "purse_from_id": purses[0].id,
+                "purse_to_id": purses[2].id,
+                "purse_from_amount": 100,
+            },
+            {
+                "purse_from_id": purses[2].id,
+                "purse_to_id": purses[1].id,
+                "purse_from_amount": 50,
+            },
+        ]
+
+        response = client.post("/api/transactions/bulk", json=data)
+        assert response.status_code == 201
+        assert Transaction.query.count() == 3
+
+        assert purses[0].balance == 800  # purse1.balance = 900 - 100 = 800
+        assert purses[2].balance == 1050  # purse3.balance = 1000 + 100 - 50 = 1050
+        assert purses[1].balance == 1095 + 50 * Rates.get_rate(
+            Currency.USD, Currency.EUR
+        )
+
+    def test_post_transactions_bulk_drain_purse(self, client, purses):
+        """
+        Test that a bulk request draining a purse exactly is not rejected by float rounding.
+
+        Args:
+            - client: The test client.
+            - purses: The list of purses.
+
+        """
+
+        db.session.get(Purse, purses[0].id).balance = 0.3
+        db.session.commit()
+        data = [
+            {
+                "purse_from_id": purses[0].id,
+                "purse_to_id": purses[2].id,
+                "purse_from_amount": 0.1,
+            }
+        ] * 3
+
+        response = client.post("/api/transactions/bulk", json=data)
+        assert response.status_code == 201
+        assert abs(purses[0].balance) < 1e-9
+
+    def test_post_transactions_bulk_not_enough_funds(self, client, purses):
+        """
+        Test that a bulk request overdrawing a purse creates no transactions.
+
+        Args:
+            - client: The test client.
+            - purses: The list of purses.
+
+        """
+
+        data = [
+            {
+                "purse_from_id": purses[0].id,
+                "purse_to_id": purses[2].id,
+                "purse_from_amount": 800,
+            },
+            {
+                "purse_from_id": purses[0].id,
+                "purse_to_id": purses[2].id,
+                "purse_from_amount": 200,
+            },
+        ]
+
+        response = client.post("/api/transactions/bulk", json=data)
+        assert response.status_code == 400
+        assert Transaction.query.count() == 1
+        assert purses[0].balance == 900
+        assert purses[2].balance == 1000
+
+    def test_post_transactions_bulk_invalid_body(self, client):
+        """
+        Test a bulk request with an invalid body.
+
+        Args:
+            - client: The test client.
+
+        """
+
+        response = client.post("/api/transactions/bulk", json={"purse_from_id": 1})
+        assert response.status_code == 400
+
+        response = client.post("/api/transactions/bulk", json=[{"purse_from_id": 1}])
+        assert response.status_code == 400
+        assert Transaction.query.count() == 1
+
+    def test_post_transactions_bulk_invalid_amount(self, client, purses):
+        """
+        Test that a bulk request with a negative, zero, boolean or NaN amount creates no
+        transactions and moves no money.
+
+        Args:
+            - client: The test client.
+            - purses: The list of purses.
+
+        """
+
+        for amount in (-50, 0, True, "NaN"):
+            data = [
+                {
+                    "purse_from_id": purses[0].id,
+                    "purse_to_id": purses[2].id,
+                    "purse_from_amount": amount,
+                }
+            ]
+            response = client.post("/api/transactions/bulk", json=data)
+            assert response.status_code == 400
+        assert Transaction.query.count() == 1
+        assert purses[0].balance == 900
+        assert purses[2].balance == 1000
+
+    def test_get_transactions_after_id(self, client, transaction):
+        """
+        Test retrieving the transactions following a given id with the after_id query parameter.
+
+        Args:
+            - client: The test client.
+            - transaction: The transaction instance.
+
+        """
+
+        response = client.get(f"/api/transactions/?after_id={transaction.id - 1}")
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json] == [transaction.id]
+
+        response = client.get(f"/api/transactions/?after_id={transaction.id}")
+        assert response.status_code == 200
+        assert response.json == []
+
+        response = client.get("/api/transactions/?after_id=-1")
+        assert response.status_code == 400
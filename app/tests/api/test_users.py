@@ -3,8 +3,13 @@ This module contains the tests for the users API.
 
 Dependencies:
     - datetime
-    - faker
+    - sqlite3
+    - types
+    - sqlalchemy.exc
+    - app
+    - app.models.purses
     - app.models.users
+    - app.rest.users
     - app.tests.fixtures
     - app.utils.validation
 
@@ -13,22 +18,26 @@ Classes:
 
 """
 
+import sqlite3
 from datetime import datetime
+from types import SimpleNamespace
 
-from faker import Faker
+from sqlalchemy.exc import IntegrityError
 
+from app import db
+from app.models.purses import Purse
 from app.models.users import User
+from app.rest.users import _unique_violation_field
 from app.tests.fixtures import (  # noqa: F401 pylint: disable=unused-import
+    fake,
     fixture_app,
     fixture_client,
     fixture_user,
 )
 from app.utils.validation import fake_phone_number
 
-fake = Faker()
 
-
-class TestUsersAPI:
+class TestUsersAPI:  # pylint: disable=too-many-public-methods
     """
     This class contains the tests for the users API.
 
@@ -45,6 +54,8 @@ class TestUsersAPI:
         with an existing email.
         - test_post_user_with_existing_phone(client, user): tests the creation of a user
         with an existing phone number.
+        - test_unique_violation_field(): tests finding the column of a violated unique
+        constraint.
         - test_post_user_with_invalid_phone(client): tests the creation of a user
         with an invalid phone number.
         - test_put_user_with_invalid_email(client): tests the creation of a user
@@ -52,6 +63,10 @@ class TestUsersAPI:
         - test_post_user_with_invalid_birth_date(client): tests the creation of a user
         with an invalid birth date.
         - test_put_user(client): tests the editing of a new user.
+        - test_put_nonexistent_user(client): tests the editing of a nonexistent user.
+        - test_put_nonexistent_user_with_invalid_data(client): tests the editing of a nonexistent
+        user with an invalid body.
+        - test_put_deleted_user(client, user): tests the editing of a deleted user.
         - test_put_user_with_existing_username(client, user): tests the editing of a user
         with an existing username.
         - test_put_user_with_existing_email(client, user): tests the editing of a user
@@ -118,8 +133,9 @@ class TestUsersAPI:
 
         response = client.delete(f"/api/users/{user.id}")
         assert response.status_code == 204
-        assert User.query.filter_by(id=user.id).count() == 1
-        assert User.query.filter_by(id=user.id).first().is_active is False
+        row = db.session.get(User, user.id)
+        assert row is not None and row.is_active is False
+        assert Purse.query.filter_by(user_id=user.id, is_active=True).count() == 0
 
     def test_delete_nonexistent_user(self, client):
         """
@@ -229,6 +245,30 @@ class TestUsersAPI:
         assert response.status_code == 400
         assert User.query.filter_by(phone=data["phone"]).count() == 1
 
+    def test_unique_violation_field(self):
+        """
+        Test that the violated column is read from the constraint name or the SQLite message,
+        not from the offending values quoted in the message.
+
+        """
+
+        postgres_error = Exception(
+            'duplicate key value violates unique constraint "users_email_key"\n'
+            "DETAIL:  Key (email)=(username@example.com) already exists."
+        )
+        postgres_error.diag = SimpleNamespace(constraint_name="users_email_key")
+        assert (
+            _unique_violation_field(IntegrityError("", {}, postgres_error)) == "email"
+        )
+
+        sqlite_error = sqlite3.IntegrityError("UNIQUE constraint failed: users.phone")
+        assert _unique_violation_field(IntegrityError("", {}, sqlite_error)) == "phone"
+
+        other_error = sqlite3.IntegrityError(
+            "NOT NULL constraint failed: users.username"
+        )
+        assert _unique_violation_field(IntegrityError("", {}, other_error)) is None
+
     def test_post_user_with_invalid_phone(self, client):
         """
         Test creating a new user with an invalid phone.
@@ -269,6 +309,10 @@ class TestUsersAPI:
         assert response.status_code == 400
         assert User.query.filter_by(birth_date=data["birth_date"]).count() == 0
 
+        data["birth_date"] = "2000-02-30"
+        response = client.post("/api/users/", data=data)
+        assert response.status_code == 400
+
     def test_put_user(self, client, user):
         """
         Test updating a user with a given ID.
@@ -299,6 +343,63 @@ class TestUsersAPI:
         )
         assert User.query.filter_by(id=user.id).count() == 1
 
+    def test_put_nonexistent_user(self, client):
+        """
+        Test updating a nonexistent user.
+
+        Args:
+            - client: The test client.
+
+        """
+
+        data = {
+            "username": fake.user_name(),
+            "email": fake.email(),
+            "phone": fake_phone_number(),
+            "first_name": fake.first_name(),
+            "last_name": fake.last_name(),
+            "birth_date": fake.date_of_birth(),
+        }
+        response = client.put("/api/users/100", data=data)
+        assert response.status_code == 404
+        assert User.query.filter_by(username=data["username"]).count() == 0
+
+    def test_put_nonexistent_user_with_invalid_data(self, client):
+        """
+        Test that updating a nonexistent user with invalid data returns 404, not 400.
+
+        Args:
+            - client: The test client.
+
+        """
+
+        data = {"email": "invalid", "phone": "invalid", "birth_date": "invalid"}
+        response = client.put("/api/users/100", data=data)
+        assert response.status_code == 404
+
+    def test_put_deleted_user(self, client, user):
+        """
+        Test that a deleted user can't be updated.
+
+        Args:
+            - client: The test client.
+            - user: The user instance.
+
+        """
+
+        client.delete(f"/api/users/{user.id}")
+        data = {
+            "username": fake.user_name(),
+            "email": fake.email(),
+            "phone": fake_phone_number(),
+            "first_name": fake.first_name(),
+            "last_name": fake.last_name(),
+            "birth_date": fake.date_of_birth(),
+        }
+        response = client.put(f"/api/users/{user.id}", data=data)
+        assert response.status_code == 404
+        assert User.query.filter_by(username=data["username"]).count() == 0
+
     def test_put_user_with_existing_username(self, client, user):
         """
         Test updating a user with an existing username.
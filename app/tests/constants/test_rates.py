@@ -0,0 +1,37 @@
+"""
+This module contains the tests for the rates module.
+
+Dependencies:
+    - app.constants.currency
+    - app.constants.rates
+
+Classes:
+    - TestRates: A class that contains the tests for the rates module.
+
+"""
+
+from app.constants.currency import Currency
+from app.constants.rates import Rates
+
+
+class TestRates:  # pylint: disable=too-few-public-methods
+    """
+    This class contains the tests for the rates module.
+
+    Methods:
+        - test_get_rate(): tests the get_rate method for every pair of currencies.
+
+    """
+
+    def test_get_rate(self):
+        """
+        Test that get_rate returns the declared rate for every pair of currencies.
+
+        """
+
+        for currency_from in Currency:
+            for currency_to in Currency:
+                assert (
+                    Rates.get_rate(currency_from, currency_to)
+                    == Rates[currency_from.name].value[currency_to]
+                )
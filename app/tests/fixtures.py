@@ -2,7 +2,9 @@
 This module contains the fixtures for the tests for the API.
 
 Dependencies:
+    - functools
     - faker
+    - sqlalchemy
     - app
     - app.config
     - app.constants.currency
@@ -12,6 +14,8 @@ Dependencies:
     - app.utils.validation
 
 Functions:
+    - _create_schema(): Recreates the database tables once per test session.
+    - _clear_tables(): Deletes the rows of every table and restarts the ids.
     - fixture_app(): A fixture creates a new app instance for each test.
     - fixture_client(app): A fixture that yields a test client for the app.
     - fixture_user(app): A fixture that yields a user for the app.
@@ -21,7 +25,10 @@ Functions:
 
 """
 
+import functools
+
 import pytest
+import sqlalchemy as sa
 from faker import Faker
 
 from app import create_app, db
@@ -32,16 +39,51 @@ from app.models.transactions import Transaction
 from app.models.users import User
 from app.utils.validation import fake_phone_number
 
+# Seeded, so the fake data of every test run is the same and a failure can be reproduced.
+Faker.seed(0)
 fake = Faker()
 
 
+@functools.cache
+def _create_schema():
+    """
+    Drops and recreates the database tables. Cached, so it only runs for the first test of
+    the session: the tables then match the current models, and the later tests reuse them.
+
+    """
+
+    db.drop_all()
+    db.create_all()
+
+
+def _clear_tables():
+    """
+    Deletes the rows of every table instead of dropping the tables, so the next test skips
+    the DDL. The ids of the next test restart at 1: SQLite reuses them once a table is empty,
+    and the other databases get their sequences reset by TRUNCATE ... RESTART IDENTITY.
+
+    """
+
+    if db.engine.dialect.name == "sqlite":
+        for table in reversed(db.metadata.sorted_tables):
+            db.session.execute(table.delete())
+    else:
+        preparer = db.engine.dialect.identifier_preparer
+        tables = ", ".join(
+            preparer.format_table(table) for table in db.metadata.sorted_tables
+        )
+        db.session.execute(sa.text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+    db.session.commit()
+
+
 @pytest.fixture(name="app")
 def fixture_app():
     """
     This fixture creates a new app instance for each test, and configures it to use the
     TestingConfig configuration class. It also creates a new database session and adds a
     user and two purses to the database. The fixture yields the app instance, and then
-    tears down the database session and drops all tables after the test is complete.
+    tears down the database session, deletes all rows and disposes of the engine after the
+    test is complete.
 
     Returns:
         - app: The app instance.
@@ -51,7 +93,7 @@ def fixture_app():
     app = create_app(config_class=TestingConfig)
 
     with app.app_context():
-        db.create_all()
+        _create_schema()
         user = User(
             username=fake.user_name(),
             email=fake.email(),
@@ -61,15 +103,16 @@ def fixture_app():
             birth_date=fake.date_of_birth(),
         )
         db.session.add(user)
-        db.session.commit()
+        # Flushing assigns the ids; the seed data is committed once below.
+        db.session.flush()
 
-        purse1 = Purse(user_id=user.id, currency=Currency.USD.value, balance=1000)
-        purse2 = Purse(user_id=user.id, currency=Currency.EUR.value, balance=1000)
-        purse3 = Purse(user_id=user.id, currency=Currency.USD.value, balance=1000)
+        purse1 = Purse(user_id=user.id, currency=Currency.USD, balance=1000)
+        purse2 = Purse(user_id=user.id, currency=Currency.EUR, balance=1000)
+        purse3 = Purse(user_id=user.id, currency=Currency.USD, balance=1000)
         db.session.add(purse1)
         db.session.add(purse2)
         db.session.add(purse3)
-        db.session.commit()
+        db.session.flush()
 
         transaction = Transaction()
         transaction.update(
@@ -91,7 +134,8 @@ def fixture_app():
 
     with app.app_context():
         db.session.remove()
-        db.drop_all()
+        _clear_tables()
+        db.engine.dispose()
 
 
 @pytest.fixture(name="client")
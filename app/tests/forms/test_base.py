@@ -21,6 +21,8 @@ class TestBaseSearchForm:
     Methods:
         - test_base_search_form(app): tests the BaseSearchForm class.
         - test_base_search_form_with_data(app): tests the BaseSearchForm class with data.
+        - test_base_search_form_without_csrf(app): tests that the BaseSearchForm class
+        skips CSRF protection.
 
     """
 
@@ -60,3 +62,19 @@ class TestBaseSearchForm:
             assert form.date_created.data == "2022-01-01"
             assert form.date_modified.data == "2022-02-01"
             assert form.validate() is True
+
+    def test_base_search_form_without_csrf(self, app):
+        """
+        Test that the BaseSearchForm class validates without a CSRF token
+        even when CSRF protection is enabled for the app.
+
+        Args:
+            - app: A Flask app object.
+
+        """
+
+        app.config["WTF_CSRF_ENABLED"] = True
+        with app.test_request_context(query_string={"search": "test"}):
+            form = BaseSearchForm()
+            assert not hasattr(form, "csrf_token")
+            assert form.validate() is True
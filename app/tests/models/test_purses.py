@@ -4,6 +4,7 @@ This module contains the tests for the Purse model class.
 Dependencies:
     - datetime
     - app.constants.currency
+    - app.models.purses
     - app.tests.models.fixtures
 
 Classes:
@@ -15,10 +16,12 @@ Classes:
 from datetime import datetime
 
 from app.constants.currency import Currency
+from app.models.purses import Purse
 from app.tests.fixtures import (  # noqa: F401 pylint: disable=unused-import
     fixture_app,
     fixture_client,
     fixture_purse,
+    fixture_purses,
     fixture_user,
 )
 
@@ -33,7 +36,9 @@ class TestPurseModel:
         - test_purse_date_conversion(): tests the date_created_str() and date_modified_str()
         methods.
         - test_purse_dict_conversion(): tests the to_dict() method.
+        - test_purse_dicts_conversion(): tests the to_dicts() method.
         - test_purse_update(): tests the update() method.
+        - test_purse_bulk_insert(): tests the bulk_insert() method.
 
     """
 
@@ -64,10 +69,7 @@ class TestPurseModel:
 
         assert (
             repr(purse)
-            == "Purse id: 1, \
-            user_id: 1, \
-            currency: Currency.USD, \
-            balance: 900.0"
+            == "Purse(id=1, user_id=1, currency=Currency.USD, balance=900.0)"
         )
 
     def test_purse_date_conversion(self, purse):
@@ -106,6 +108,17 @@ class TestPurseModel:
             "%Y-%m-%d"
         )
 
+    def test_purse_dicts_conversion(self, purses):
+        """
+        Test the to_dicts() method.
+
+        Args:
+            - purses: A list of Purse objects.
+
+        """
+
+        assert Purse.to_dicts() == [purse.to_dict() for purse in purses]
+
     def test_purse_update(self, purse):
         """
         Test the update() method.
@@ -115,6 +128,30 @@ class TestPurseModel:
 
         """
 
-        purse.update(balance=200.0, is_active=False)
+        date_created = purse.date_created
+        purse.update(balance=200.0, is_active=False, date_created="", date_modified="")
         assert purse.balance == 200.0
         assert purse.is_active is False
+        assert purse.date_created == date_created
+
+    def test_purse_bulk_insert(self, user):
+        """
+        Test the bulk_insert() method.
+
+        Args:
+            - user: A User object.
+
+        """
+
+        Purse.bulk_insert(
+            [
+                {"user_id": user.id, "currency": Currency.GBP, "balance": 10.0},
+                {"user_id": user.id, "currency": Currency.UAH},
+            ]
+        )
+        purses = Purse.query.filter(
+            Purse.currency.in_([Currency.GBP, Currency.UAH])
+        ).all()
+        assert [purse.balance for purse in purses] == [10.0, 0.0]
+        assert all(purse.is_active for purse in purses)
+        assert all(purse.date_created is not None for purse in purses)
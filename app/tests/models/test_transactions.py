@@ -3,7 +3,9 @@ This module contains the tests for the Transaction model class.
 
 Dependencies:
     - datetime
+    - pytest
     - app.constants.currency
+    - app.models.transactions
     - app.tests.models.fixtures
 
 Classes:
@@ -14,7 +16,10 @@ Classes:
 
 from datetime import datetime
 
+import pytest
+
 from app.constants.currency import Currency
+from app.models.transactions import InsufficientFunds, Transaction
 from app.tests.fixtures import (  # noqa: F401 pylint: disable=unused-import
     fixture_app,
     fixture_client,
@@ -35,6 +40,10 @@ class TestTransactionModel:
         - test_transaction_date_conversion(): tests the date_created_str() and date_modified_str()
         methods.
         - test_transaction_dict_conversion(): tests the to_dict() method.
+        - test_transaction_dicts_conversion(): tests the to_dicts() method.
+        - test_transaction_update_with_purses(): tests the update() method with purse objects.
+        - test_transaction_update_not_enough_money(): tests that the update() method refuses
+        to overdraw a purse.
 
     """
 
@@ -65,14 +74,9 @@ class TestTransactionModel:
         """
 
         assert (
-            repr(transaction)
-            == "Transaction id: 1, \
-            purse_from_id: 1, \
-            purse_to_id: 2, \
-            purse_from_currency: Currency.USD, \
-            purse_to_currency: Currency.EUR, \
-            purse_from_amount: 100.0, \
-            purse_to_amount: 95.0"
+            repr(transaction) == "Transaction(id=1, purse_from_id=1, purse_to_id=2, "
+            "purse_from_currency=Currency.USD, purse_to_currency=Currency.EUR, "
+            "purse_from_amount=100.0, purse_to_amount=95.0)"
         )
 
     def test_transaction_date_conversion(self, transaction):
@@ -107,3 +111,57 @@ class TestTransactionModel:
         assert transaction_dict["date_created"].split(" ")[
             0
         ] == datetime.utcnow().strftime("%Y-%m-%d")
+
+    def test_transaction_dicts_conversion(self, transaction):
+        """
+        Test the to_dicts() method.
+
+        Args:
+            - transaction: A transaction object.
+
+        """
+
+        assert Transaction.to_dicts() == [transaction.to_dict()]
+
+    def test_transaction_update_with_purses(self, purses):
+        """
+        Test the update() method with the purses passed in as objects.
+
+        Args:
+            - purses: A list of purse objects.
+
+        """
+
+        purse_from, purse_to = purses[0], purses[2]
+        transaction = Transaction()
+        transaction.update(
+            purse_from=purse_from,
+            purse_to=purse_to,
+            purse_from_id=purse_from.id,
+            purse_to_id=purse_to.id,
+            purse_from_amount=100,
+        )
+        assert transaction.purse_from is purse_from
+        assert transaction.purse_to is purse_to
+        assert transaction.purse_to_amount == 100
+        assert purse_from.balance == 800
+        assert purse_to.balance == 1100
+
+    def test_transaction_update_not_enough_money(self, purses):
+        """
+        Test that the update() method refuses to overdraw a purse.
+
+        Args:
+            - purses: A list of purse objects.
+
+        """
+
+        purse_from, purse_to = purses[0], purses[2]
+        with pytest.raises(InsufficientFunds):
+            Transaction().update(
+                purse_from_id=purse_from.id,
+                purse_to_id=purse_to.id,
+                purse_from_amount=purse_from.balance + 1,
+            )
+        assert purse_from.balance == 900
+        assert purse_to.balance == 1000
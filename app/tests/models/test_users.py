@@ -3,6 +3,7 @@ This module contains the tests for the User model class.
 
 Dependencies:
     - datetime
+    - app.models.users
     - app.tests.models.fixtures
 
 Classes:
@@ -10,8 +11,9 @@ Classes:
 
 """
 
-from datetime import datetime
+from datetime import date
 
+from app.models.users import User
 from app.tests.fixtures import (  # noqa: F401 pylint: disable=unused-import
     fixture_app,
     fixture_client,
@@ -30,7 +32,9 @@ class TestUserModel:
         - test_date_created_str(): tests the date_created_str() method.
         - test_date_modified_str(): tests the date_modified_str() method.
         - test_to_dict(): tests the to_dict() method.
+        - test_to_dicts(): tests the to_dicts() method.
         - test_update(): tests the update() method.
+        - test_bulk_insert(): tests the bulk_insert() method.
 
     """
 
@@ -60,11 +64,8 @@ class TestUserModel:
         """
 
         assert (
-            repr(user)
-            == f"User id: 1, \
-            name: {user.username}, \
-            email: {user.email}, \
-            phone: {user.phone}"
+            repr(user) == f"User(id=1, username={user.username}, "
+            f"email={user.email}, phone={user.phone})"
         )
 
     def test_birth_date_str(self, user):
@@ -122,6 +123,18 @@ class TestUserModel:
         }
         assert user.to_dict() == expected_dict
 
+    def test_to_dicts(self, user):
+        """
+        Test the to_dicts() method.
+
+        Args:
+            - user: A User object.
+
+        """
+
+        assert User.to_dicts() == [user.to_dict()]
+        assert not User.to_dicts(offset=1)
+
     def test_update(self, user):
         """
         Test the update() method.
@@ -131,6 +144,41 @@ class TestUserModel:
 
         """
 
-        user.update(username="newtestuser", birth_date="1999-12-31")
+        date_created = user.date_created
+        user.update(
+            username="newtestuser",
+            birth_date="1999-12-31",
+            date_created="",
+            csrf_token="",
+        )
         assert user.username == "newtestuser"
-        assert user.birth_date == datetime(1999, 12, 31)
+        assert user.birth_date == date(1999, 12, 31)
+        assert user.date_created == date_created
+        assert not hasattr(user, "csrf_token")
+
+    def test_bulk_insert(self, user):
+        """
+        Test the bulk_insert() method.
+
+        Args:
+            - user: A User object.
+
+        """
+
+        User.bulk_insert(
+            [
+                {
+                    "username": "bulkuser",
+                    "email": "bulkuser@example.com",
+                    "phone": "+123456789012",
+                    "first_name": "Bulk",
+                    "last_name": "User",
+                    "birth_date": date(1990, 1, 1),
+                }
+            ]
+        )
+        new_user = User.query.filter(User.id != user.id).one()
+        assert new_user.username == "bulkuser"
+        assert new_user.birth_date == date(1990, 1, 1)
+        assert new_user.is_active is True
+        assert new_user.date_created is not None
@@ -2,6 +2,9 @@
 This module contains the tests for the Flask app.
 
 Dependencies:
+    - sqlalchemy
+    - app
+    - app.config
     - app.webapp
 
 Classes:
@@ -9,6 +12,10 @@ Classes:
 
 """
 
+import sqlalchemy as sa
+
+from app import create_app, db
+from app.config import Config, _engine_options
 from app.webapp import app
 
 
@@ -19,6 +26,10 @@ class TestWebapp:
     Methods:
         - test_app_creation(): tests the creation of the Flask app.
         - test_app_run(): tests the running of the Flask app.
+        - test_sqlite_pragmas(): tests the tuning of the SQLite connections.
+        - test_migrate_command(): tests the lazily registered `flask db` command group.
+        - test_in_memory_sqlite(): tests the engine options of an in-memory SQLite database.
+        - test_file_sqlite_pool(): tests that a SQLite database file keeps a connection pool.
 
     """
 
@@ -39,3 +50,55 @@ class TestWebapp:
         with app.test_client() as client:
             response = client.get("/")
             assert response.status_code == 200
+
+    def test_sqlite_pragmas(self):
+        """
+        Test that SQLite connections use write-ahead logging and relaxed syncing.
+
+        """
+
+        with app.app_context():
+            assert db.session.execute(sa.text("PRAGMA journal_mode")).scalar() == "wal"
+            assert db.session.execute(sa.text("PRAGMA synchronous")).scalar() == 1
+
+    def test_migrate_command(self):
+        """
+        Test that the `flask db` command group lists the Flask-Migrate commands.
+
+        """
+
+        result = app.test_cli_runner().invoke(args=["db", "--help"])
+        assert result.exit_code == 0
+        assert "upgrade" in result.output
+        assert "migrate" in app.extensions
+
+    def test_in_memory_sqlite(self):
+        """
+        Test that the base configuration works with an in-memory SQLite database.
+
+        """
+
+        class InMemoryConfig(Config):  # pylint: disable=too-few-public-methods
+            """
+            The base configuration with an in-memory SQLite database.
+
+            """
+
+            SQLALCHEMY_DATABASE_URI = "sqlite://"
+            SQLALCHEMY_ENGINE_OPTIONS = _engine_options(SQLALCHEMY_DATABASE_URI)
+
+        in_memory_app = create_app(config_class=InMemoryConfig)
+        with in_memory_app.app_context():
+            assert db.session.execute(sa.text("SELECT 1")).scalar() == 1
+            db.session.remove()
+            db.engine.dispose()
+
+    def test_file_sqlite_pool(self):
+        """
+        Test that a SQLite database file gets a QueuePool, so threads don't share a connection.
+
+        """
+
+        assert "poolclass" not in _engine_options("sqlite:///dev.db")
+        with app.app_context():
+            assert isinstance(db.engine.pool, sa.pool.QueuePool)
@@ -0,0 +1,162 @@
+"""
+This module contains the tests for the cache module.
+
+Dependencies:
+    - app
+    - app.models.purses
+    - app.tests.fixtures
+    - app.utils.cache
+
+Classes:
+    - TestCache: A class that contains the tests for the cache module.
+
+"""
+
+from app import db
+from app.models.purses import Purse
+from app.tests.fixtures import (  # noqa: F401 pylint: disable=unused-import
+    fixture_app,
+    fixture_client,
+    fixture_purse,
+)
+from app.utils.cache import cached_get, clear_cache
+
+
+class CountingResource:  # pylint: disable=too-few-public-methods
+    """
+    A resource stub that counts the calls of its get method.
+
+    """
+
+    calls = 0
+
+    @cached_get
+    def get(self, _id):
+        """
+        Returns a dictionary with the given _id and counts the call.
+
+        """
+
+        CountingResource.calls += 1
+        return {"id": _id}
+
+
+class CommittingResource:  # pylint: disable=too-few-public-methods
+    """
+    A resource stub whose get method is interrupted by a commit, which clears the cache.
+
+    """
+
+    calls = 0
+
+    @cached_get
+    def get(self, _id):
+        """
+        Returns a dictionary with the given _id, counts the call and clears the cache.
+
+        """
+
+        CommittingResource.calls += 1
+        clear_cache()
+        return {"id": _id}
+
+
+class TestCache:
+    """
+    This class contains the tests for the cache module.
+
+    Methods:
+        - test_cached_get(app): tests that the cached_get decorator caches by _id.
+        - test_cache_cleared_on_commit(client, purse): tests that a commit clears the cache.
+        - test_commit_during_get(app): tests that a response computed across a commit is not
+        cached.
+        - test_conditional_get(client, purse): tests the ETag and If-None-Match handling.
+
+    """
+
+    def test_cached_get(self, app):
+        """
+        Test that the cached_get decorator caches the encoded result per _id.
+
+        Args:
+            - app: The app instance.
+
+        """
+
+        # pylint: disable=no-member
+        # The decorated get returns a Response, not the dict of the undecorated method.
+        clear_cache()
+        resource = CountingResource()
+        with app.test_request_context():
+            first = resource.get(1)
+            second = resource.get(1)
+            assert first.get_json() == second.get_json() == {"id": 1}
+            assert first.headers["ETag"] == second.headers["ETag"]
+            assert CountingResource.calls == 1
+            assert resource.get(2).get_json() == {"id": 2}
+            assert CountingResource.calls == 2
+
+    def test_commit_during_get(self, app):
+        """
+        Test that a response computed while a commit cleared the cache is not stored.
+
+        Args:
+            - app: The app instance.
+
+        """
+
+        clear_cache()
+        resource = CommittingResource()
+        with app.test_request_context():
+            resource.get(1)
+            resource.get(1)
+        assert CommittingResource.calls == 2
+
+    def test_cache_cleared_on_commit(self, client, purse):
+        """
+        Test that a committed change is returned by the next request.
+
+        Args:
+            - client: The test client.
+            - purse: The purse instance.
+
+        """
+
+        response = client.get(f"/api/purses/{purse.id}")
+        assert response.json["balance"] == 900
+
+        db.session.get(Purse, purse.id).balance = 500
+        db.session.commit()
+
+        response = client.get(f"/api/purses/{purse.id}")
+        assert response.json["balance"] == 500
+
+    def test_conditional_get(self, client, purse):
+        """
+        Test that an unchanged resource is answered with 304 Not Modified.
+
+        Args:
+            - client: The test client.
+            - purse: The purse instance.
+
+        """
+
+        response = client.get(f"/api/purses/{purse.id}")
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = client.get(
+            f"/api/purses/{purse.id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.data == b""
+
+        db.session.get(Purse, purse.id).balance = 500
+        db.session.commit()
+
+        response = client.get(
+            f"/api/purses/{purse.id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json["balance"] == 500
@@ -0,0 +1,48 @@
+"""
+This module contains the tests for the formatting module.
+
+Dependencies:
+    - datetime
+    - app.utils.formatting
+
+Classes:
+    - TestFormatting: A class that contains the tests for the formatting module.
+
+"""
+
+from datetime import date, datetime
+
+from app.utils.formatting import date_str, datetime_str
+
+
+class TestFormatting:
+    """
+    This class contains the tests for the formatting module.
+
+    Methods:
+        - test_date_str(): tests the date_str function.
+        - test_datetime_str(): tests the datetime_str function.
+
+    """
+
+    def test_date_str(self):
+        """
+        Test date_str function.
+
+        """
+
+        value = date(1987, 3, 6)
+        assert date_str(value) == value.strftime("%Y-%m-%d") == "1987-03-06"
+
+    def test_datetime_str(self):
+        """
+        Test datetime_str function.
+
+        """
+
+        value = datetime(2023, 3, 6, 4, 5, 9, 123456)
+        assert (
+            datetime_str(value)
+            == value.strftime("%Y-%m-%d %H:%M:%S")
+            == "2023-03-06 04:05:09"
+        )
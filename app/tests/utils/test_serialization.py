@@ -0,0 +1,87 @@
+"""
+This module contains the tests for the serialization module.
+
+Dependencies:
+    - datetime
+    - json
+    - flask
+    - app.tests.fixtures
+    - app.utils.serialization
+
+Classes:
+    - TestSerialization: A class that contains the tests for the serialization module.
+
+"""
+
+import json
+from datetime import datetime
+
+from flask import jsonify
+
+from app.tests.fixtures import fixture_app  # noqa: F401 pylint: disable=unused-import
+from app.utils.serialization import OrjsonProvider, output_json
+
+
+class TestSerialization:
+    """
+    This class contains the tests for the serialization module.
+
+    Methods:
+        - test_output_json(app): tests the output_json function.
+        - test_output_json_with_headers(app): tests the output_json function with headers.
+        - test_orjson_provider(app): tests the OrjsonProvider class.
+
+    """
+
+    def test_output_json(self, app):
+        """
+        Test output_json function.
+
+        Args:
+            - app: A Flask app object.
+
+        """
+
+        data = {"id": 1, "balance": 1095.0, "date_created": datetime(2023, 3, 6, 14, 5)}
+        with app.test_request_context():
+            response = output_json(data, 201)
+            assert response.status_code == 201
+            assert response.get_data(as_text=True).endswith("\n")
+            assert json.loads(response.get_data()) == {
+                "id": 1,
+                "balance": 1095.0,
+                "date_created": "2023-03-06T14:05:00+00:00",
+            }
+
+    def test_output_json_with_headers(self, app):
+        """
+        Test output_json function with headers.
+
+        Args:
+            - app: A Flask app object.
+
+        """
+
+        with app.test_request_context():
+            response = output_json([], 200, headers={"X-Total-Count": "0"})
+            assert response.headers["X-Total-Count"] == "0"
+            assert json.loads(response.get_data()) == []
+
+    def test_orjson_provider(self, app):
+        """
+        Test OrjsonProvider class.
+
+        Args:
+            - app: A Flask app object.
+
+        """
+
+        assert isinstance(app.json, OrjsonProvider)
+        assert app.json.loads(app.json.dumps({"id": 1})) == {"id": 1}
+        with app.test_request_context():
+            response = jsonify(id=1, date_created=datetime(2023, 3, 6, 14, 5))
+            assert response.mimetype == "application/json"
+            assert json.loads(response.get_data()) == {
+                "id": 1,
+                "date_created": "2023-03-06T14:05:00+00:00",
+            }
@@ -3,7 +3,6 @@ This module contains the tests for the validation module.
 
 Dependencies:
     - re
-    - faker
     - app.tests.fixtures
     - app.utils.validation
 
@@ -14,9 +13,8 @@ Classes:
 
 import re
 
-from faker import Faker
-
 from app.tests.fixtures import (  # noqa: F401 pylint: disable=unused-import
+    fake,
     fixture_app,
     fixture_user,
 )
@@ -30,8 +28,6 @@ from app.utils.validation import (
     is_valid_phone_number,
 )
 
-fake = Faker()
-
 
 class TestValidation:
     """
@@ -3,7 +3,6 @@ This module contains the tests for the transactions view.
 
 Dependencies:
     - datetime
-    - faker
     - app.constants.currency
     - app.models.api.fixtures
 
@@ -14,8 +13,6 @@ Classes:
 
 from datetime import datetime
 
-from faker import Faker
-
 from app.constants.currency import Currency
 from app.tests.fixtures import (  # noqa: F401 pylint: disable=unused-import
     fixture_app,
@@ -26,8 +23,6 @@ from app.tests.fixtures import (  # noqa: F401 pylint: disable=unused-import
     fixture_user,
 )
 
-fake = Faker()
-
 
 class TestTransactionsView:
     """
@@ -40,6 +35,8 @@ class TestTransactionsView:
         - test_get_nonexistent_transaction(client, transaction): tests the retrieval of a
         transaction that does not exist.
         - test_create_transaction(client, purses): tests the creation of a transaction.
+        - test_create_transaction_with_nonexistent_purse(client, purses): tests the creation
+        of a transaction from or to a purse that does not exist.
 
     """
 
@@ -194,3 +191,29 @@ class TestTransactionsView:
 
         assert purses[0].balance == 800  # purse1.balance = 900 - 100 = 800
         assert purses[1].balance == 1190  # purse2.balance = 1095 + 95 = 1190
+
+    def test_create_transaction_with_nonexistent_purse(self, client, purses):
+        """
+        Test creating a transaction from or to a purse that does not exist.
+
+        Args:
+            - client: The test client.
+            - purses: The list of purses.
+
+        """
+
+        for purse_from_id, purse_to_id in (
+            (9999, purses[1].id),
+            (purses[0].id, 9999),
+            ("invalid", purses[1].id),
+        ):
+            data = {
+                "purse_from_id": purse_from_id,
+                "purse_to_id": purse_to_id,
+                "purse_from_amount": 100,
+            }
+            response = client.post("/transactions/0", data=data)
+            assert response.status_code == 404
+
+        assert purses[0].balance == 900
+        assert purses[1].balance == 1095
@@ -3,7 +3,6 @@ This module contains the tests for the users view.
 
 Dependencies:
     - datetime
-    - faker
     - app.models.users
     - app.tests.views.fixtures
     - app.utils.validation
@@ -15,18 +14,15 @@ Classes:
 
 from datetime import datetime
 
-from faker import Faker
-
 from app.models.users import User
 from app.tests.fixtures import (  # noqa: F401 pylint: disable=unused-import
+    fake,
     fixture_app,
     fixture_client,
     fixture_user,
 )
 from app.utils.validation import fake_phone_number
 
-fake = Faker()
-
 
 class TestUsersView:
     """
@@ -0,0 +1,94 @@
+"""
+This module contains a short-lived read-through cache for the single-resource GET endpoints
+of the REST API. Cached responses are dropped after a few seconds and whenever any database
+session commits, so a change is never served stale by the process that made it. Each clear
+also starts a new generation, and a response computed in an earlier generation is not stored,
+since it may predate a commit that ran while it was being computed.
+
+Each cached response is stored as its encoded JSON body and the ETag of that body, both
+computed once when the response is cached. A request whose If-None-Match header holds the
+ETag gets an empty 304 Not Modified response.
+
+Dependencies:
+    - functools
+    - threading
+    - cachetools
+    - flask
+    - sqlalchemy.event
+    - sqlalchemy.orm
+    - werkzeug.http
+    - app.utils.serialization
+
+Functions:
+    - cached_get(get): decorates a Resource.get(self, _id) method with the cache.
+    - clear_cache(): removes all the cached responses.
+
+"""
+
+import functools
+import threading
+
+from cachetools import TTLCache
+from flask import current_app, request
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from werkzeug.http import generate_etag, quote_etag
+
+from app.utils.serialization import encode_json
+
+_cache = TTLCache(maxsize=10_000, ttl=5)
+_lock = threading.Lock()
+# Incremented by every clear_cache() call
+_generation = 0  # pylint: disable=invalid-name
+
+
+def cached_get(get):
+    """
+    Decorate a Resource.get(self, _id) method so its response is served from the cache,
+    keyed by the resource class name and the _id. On a cache miss the result of the method
+    is encoded and its ETag computed; a hit reuses both without serializing again.
+    Errors are raised by the decorated method and are never cached.
+
+    Args:
+        - get (function): The get method to decorate.
+
+    Returns:
+        - wrapper (function): The decorated get method.
+
+    """
+
+    @functools.wraps(get)
+    def wrapper(self, _id):
+        key = (type(self).__name__, _id)
+        with _lock:
+            entry = _cache.get(key)
+            generation = _generation
+        if entry is None:
+            body = encode_json(get(self, _id))
+            entry = (body, generate_etag(body))
+            with _lock:
+                if generation == _generation:
+                    _cache[key] = entry
+        body, etag = entry
+        headers = {"ETag": quote_etag(etag)}
+        if request.if_none_match.contains(etag):
+            return current_app.response_class(status=304, headers=headers)
+        return current_app.response_class(
+            body, headers=headers, mimetype="application/json"
+        )
+
+    return wrapper
+
+
+@event.listens_for(Session, "after_commit")
+def clear_cache(*_):
+    """
+    Remove all the cached responses and start a new generation. Called after every commit
+    of a database session.
+
+    """
+
+    global _generation  # pylint: disable=global-statement
+    with _lock:
+        _cache.clear()
+        _generation += 1
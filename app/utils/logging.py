@@ -3,6 +3,7 @@ This module contains the setup_logging function, which
 configures logging for the e-wallet application.
 
 Dependencies:
+    - functools
     - logging
     - sys
 
@@ -11,10 +12,12 @@ Functions:
 
 """
 
+import functools
 import logging
 import sys
 
 
+@functools.lru_cache(maxsize=None)
 def setup_logging():
     """
     Set up logging configuration for the e-wallet application.
@@ -26,6 +29,9 @@ def setup_logging():
     Additionally, this function adds a console handler to the root logger to print log messages
     to the console.
 
+    The configuration is applied only once per process, so creating several apps (as the tests
+    do) doesn't stack up duplicate console handlers.
+
     """
     logging.basicConfig(
         filename="e-wallet.log",
@@ -0,0 +1,127 @@
+"""
+This module contains the output_json function and the OrjsonProvider class, which serialize
+the REST API and the Flask app responses with orjson instead of the standard library json module.
+
+Dependencies:
+    - flask
+    - orjson
+
+Exported classes:
+    - OrjsonProvider
+
+Functions:
+    - encode_json(data): encodes data to the JSON bytes of a response body.
+    - output_json(data, code, headers=None): makes a Flask response with a JSON encoded body.
+
+"""
+
+from flask import make_response
+from flask.json.provider import JSONProvider
+from orjson import (  # pylint: disable=no-name-in-module
+    OPT_APPEND_NEWLINE,
+    OPT_NAIVE_UTC,
+    dumps,
+    loads,
+)
+
+
+def encode_json(data):
+    """
+    Encode data to the JSON bytes of a response body. Naive datetimes are serialized as UTC
+    and the body ends with a newline.
+
+    Args:
+        - data: The data to serialize.
+
+    Returns:
+        - bytes: The JSON encoded data.
+
+    """
+
+    return dumps(data, option=OPT_NAIVE_UTC | OPT_APPEND_NEWLINE)
+
+
+def output_json(data, code, headers=None):
+    """
+    Make a Flask response with a JSON encoded body.
+
+    orjson encodes straight to bytes, so the body skips the str -> bytes step of the
+    standard library encoder used by Flask-RESTful by default. Naive datetimes are
+    serialized as UTC.
+
+    Args:
+        - data: The data to serialize.
+        - code (int): The HTTP status code of the response.
+        - headers (dict, optional): Additional headers of the response.
+
+    Returns:
+        - resp (Response): The Flask response.
+
+    """
+
+    resp = make_response(encode_json(data), code)
+    resp.headers.extend(headers or {})
+    return resp
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    A Flask JSON provider that uses orjson. It serves flask.jsonify and the dicts and lists
+    returned from views, in the same format as output_json.
+
+    Methods:
+        - dumps(obj, **kwargs): Serializes the data to a JSON string.
+        - loads(s, **kwargs): Deserializes the data from a JSON string or bytes.
+        - response(*args, **kwargs): Makes a Flask response with a JSON encoded body.
+
+    """
+
+    def dumps(self, obj, **kwargs):
+        """
+        Serialize the data to a JSON string.
+
+        Args:
+            - obj: The data to serialize.
+            - **kwargs: Ignored, orjson has no equivalent of the json.dumps arguments.
+
+        Returns:
+            - str: The JSON string.
+
+        """
+
+        return dumps(obj, option=OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        """
+        Deserialize the data from a JSON string or bytes.
+
+        Args:
+            - s (str | bytes): The JSON to deserialize.
+            - **kwargs: Ignored, orjson has no equivalent of the json.loads arguments.
+
+        Returns:
+            - The deserialized data.
+
+        """
+
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        """
+        Make a Flask response with a JSON encoded body. The body is passed on as bytes,
+        without the decode and re-encode done by the default provider.
+
+        Args:
+            - *args: A single value to serialize, or several values to serialize as a list.
+            - **kwargs: Values to serialize as a dict.
+
+        Returns:
+            - Response: The Flask response.
+
+        """
+
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            encode_json(obj),
+            mimetype="application/json",
+        )
@@ -48,10 +48,17 @@ def make_query():
 
     """
 
-    purses_query = db.session.query(
-        Purse,
-    ).filter(
-        Purse.is_active == True  # pylint: disable=singleton-comparison # noqa: E712
+    purses_query = (
+        db.session.query(
+            Purse,
+        )
+        .options(
+            sa.orm.selectinload(Purse.transactions_from),
+            sa.orm.selectinload(Purse.transactions_to),
+        )
+        .filter(
+            Purse.is_active == True  # pylint: disable=singleton-comparison # noqa: E712
+        )
     )
 
     if request.args.get("search"):
@@ -184,7 +191,7 @@ class PurseBlueprint(Blueprint):
         )
         context["url"] = "purse_bp.list"
 
-        logging.info("Retrieved all purses. Count: %s.", len(purses.all()))
+        logging.info("Retrieved all purses. Count: %s.", context["pagination"].total)
         return render_template("purses/list.html", **context)
 
     def edit(self, _id):
@@ -205,7 +212,7 @@ class PurseBlueprint(Blueprint):
             context["purse"] = {}
             purse = Purse()
         else:
-            purse = Purse.query.get(_id)
+            purse = db.session.get(Purse, _id)
 
         if not purse:
             logging.error("Purse %s does not exist.", _id)
@@ -248,7 +255,7 @@ class PurseBlueprint(Blueprint):
         """
 
         _id = int(_id)
-        purse = Purse.query.get(_id)
+        purse = db.session.get(Purse, _id)
 
         try:
             purse.is_active = False
@@ -19,6 +19,7 @@ Exported classes:
 
 Functions:
     - make_query: Creates a query for the list endpoint.
+    - _get_purse_or_404: Retrieves the purse whose id is posted in a form field.
 
 """
 
@@ -31,7 +32,7 @@ from app import db
 from app.constants.rates import Currency, Rates
 from app.forms.transactions import SearchForm, TransactionForm
 from app.models.purses import Purse
-from app.models.transactions import Transaction
+from app.models.transactions import InsufficientFunds, Transaction
 
 PER_PAGE = 10
 
@@ -116,6 +117,26 @@ def make_query():
     return transactions_query
 
 
+def _get_purse_or_404(field):
+    """
+    Retrieves the purse whose id is posted in the given form field or aborts the request
+    with a 404 error if it doesn't exist.
+
+    Args:
+        - field (str): The name of the form field holding the purse id.
+
+    Returns:
+        - purse (Purse): The purse with the posted id.
+
+    """
+
+    purse_id = request.form.get(field, type=int)
+    if purse_id is None:
+        logging.error("Purse %s does not exist.", request.form.get(field))
+        abort(404, f"Purse with id {request.form.get(field)} does not exist.")
+    return db.get_or_404(Purse, purse_id)
+
+
 class TransactionBlueprint(Blueprint):
     """
     This class is a subclass of the Flask Blueprint class. It is used to define the routes for the
@@ -207,7 +228,7 @@ class TransactionBlueprint(Blueprint):
             context["transaction"] = {}
             transaction = Transaction()
         else:
-            transaction = Transaction.query.get(_id)
+            transaction = db.session.get(Transaction, _id)
 
         if not transaction:
             logging.error("Transaction %s does not exist.", _id)
@@ -216,12 +237,23 @@ class TransactionBlueprint(Blueprint):
         form = TransactionForm()
         if request.method == "POST":
             formdata = request.form
-            form = TransactionForm(formdata=formdata, _id=_id)
+            purse_from = _get_purse_or_404("purse_from_id")
+            purse_to = _get_purse_or_404("purse_to_id")
+            form = TransactionForm(formdata=formdata, _id=_id, purse_from=purse_from)
 
             if not form.validate():
                 context["errors"] = form.errors
             else:
-                transaction.update(**dict(form.data.items()))
+                try:
+                    transaction.update(
+                        **dict(form.data.items()),
+                        purse_from=purse_from,
+                        purse_to=purse_to,
+                    )
+                except InsufficientFunds as error:
+                    db.session.rollback()
+                    logging.error(str(error))
+                    abort(400, str(error))
 
                 db.session.add(transaction)
                 logging.info("Created new transaction with id %s.", transaction.id)
@@ -55,6 +55,7 @@ def make_query():
             ),
         )
         .outerjoin(Purse)
+        .options(sa.orm.selectinload(User.purses))
         .filter(
             User.is_active == True  # pylint: disable=singleton-comparison # noqa: E712
         )
@@ -205,7 +206,7 @@ class UserBlueprint(Blueprint):
             context["user"] = {}
             user = User()
         else:
-            user = User.query.get(_id)
+            user = db.session.get(User, _id)
 
         if not user:
             logging.error("User %s does not exist.", _id)
@@ -250,12 +251,12 @@ class UserBlueprint(Blueprint):
         """
 
         _id = int(_id)
-        user = User.query.get(_id)
-        purses = Purse.query.filter_by(user_id=_id).all()
+        user = db.session.get(User, _id)
 
         try:
-            for purse in purses:
-                purse.is_active = False
+            purses = db.session.execute(
+                db.update(Purse).where(Purse.user_id == _id).values(is_active=False)
+            )
             user.is_active = False
             db.session.commit()
         except IntegrityError:  # pragma: no cover
@@ -263,5 +264,5 @@ class UserBlueprint(Blueprint):
             return {"message": "User cannot be deleted"}, 400
 
         logging.info("Deleted user %s.", _id)
-        logging.info("Deleted %s purses for user %s.", len(purses), _id)
+        logging.info("Deleted %s purses for user %s.", purses.rowcount, _id)
         return {"message": "User deleted"}, 200
@@ -3,6 +3,7 @@ from setuptools import find_packages, setup
 requires = [
     "alembic==1.10.2",
     "aniso8601==9.0.1",
+    "cachetools==5.3.0",
     "click==8.1.3",
     "Faker==17.6.0",
     "Flask==2.2.3",
@@ -15,6 +16,7 @@ requires = [
     "Jinja2==3.1.2",
     "Mako==1.2.4",
     "MarkupSafe==2.1.2",
+    "orjson==3.8.3",
     "python-dateutil==2.8.2",
     "pytz==2022.7.1",
     "six==1.16.0",